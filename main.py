@@ -4,10 +4,12 @@ YouTube Playlist Manager - Main Orchestrator
 Smart sync • Auto-download • Safe cleanup • Duplicate protection
 """
 
+import mmap
 import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import time
@@ -25,15 +27,22 @@ from src.core.utils import (
     is_probably_url,
     looks_like_playlist_url,
 )
+from src.core.cli import safe_input, ESCAPE_SENTINEL
 from src.core.settings import load_settings, save_settings, setup_preferences
-from src.core.downloader import PlaylistSyncer, PlaylistInfo, SyncMode
-from src.core.progress import ProgressBar, format_bytes, format_speed, format_eta
-from src.flows.sync_flow import run_sync_mode as run_sync_mode_flow
-from src.flows.single_flow import run_single_download_mode
 
-ESCAPE_SENTINEL = "__SAFE_INPUT_ESC__"
+# Downloader, progress UI and the menu flows are imported where they are used so
+# that starting the menu (or exiting straight away) does not pay for them.
+
 PROJECT_ROOT = Path(__file__).resolve().parent
 
+# Environment switches consulted at exit; the environment does not change mid-run.
+_ENV_VSCODE = os.environ.get("TERM_PROGRAM", "").lower() == "vscode"
+_ENV_WT = bool(os.environ.get("WT_SESSION"))
+_ENV_NO_PAUSE = os.environ.get("YPM_NO_PAUSE", "").lower() in {"1", "true", "yes"}
+
+# Matches lines like: "C:\Python312\python.exe" main.py
+_BAT_PYTHON_RE = re.compile(rb'(?mi)^[ \t]*"([^"\r\n]+python\.exe)"[ \t]+main\.py[ \t]*\r?$')
+
 
 def should_pause_before_exit() -> bool:
     """Best-effort detection for Windows click-launch sessions.
@@ -41,19 +50,7 @@ def should_pause_before_exit() -> bool:
     We avoid pausing inside common developer terminals (VS Code / Windows Terminal)
     while keeping the window open when launched directly via file association.
     """
-    if os.name != "nt":
-        return False
-
-    if os.environ.get("TERM_PROGRAM", "").lower() == "vscode":
-        return False
-
-    if os.environ.get("WT_SESSION"):
-        return False
-
-    if os.environ.get("YPM_NO_PAUSE", "").lower() in {"1", "true", "yes"}:
-        return False
-
-    return True
+    return not (os.name != "nt" or _ENV_VSCODE or _ENV_WT or _ENV_NO_PAUSE)
 
 
 def pause_before_exit() -> None:
@@ -68,7 +65,18 @@ def pause_before_exit() -> None:
     except EOFError:
         pass
 
-    # Fallback for non-interactive console sessions.
+    # Fallback for non-interactive console sessions: read a key straight from
+    # the console before resorting to spawning cmd.exe for `pause`.
+    try:
+        import msvcrt
+
+        sys.stdout.write("\nPress any key to close...")
+        sys.stdout.flush()
+        msvcrt.getch()
+        return
+    except Exception:
+        pass
+
     try:
         os.system("pause")
     except Exception:
@@ -97,27 +105,20 @@ def _ensure_console_python() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
 def _read_run_system_python_exe() -> str:
     """Best-effort parse of run_system_python.bat to discover preferred interpreter."""
     bat = PROJECT_ROOT / "run_system_python.bat"
-    if not bat.exists():
-        return ""
-
     try:
-        content = bat.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
+        with open(bat, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _BAT_PYTHON_RE.finditer(mm):
+                candidate = match.group(1).decode("utf-8", errors="ignore")
+                if Path(candidate).exists():
+                    return candidate
+    except (OSError, ValueError):
+        # Missing/unreadable file, or an empty file (mmap cannot map 0 bytes).
         return ""
 
-    for line in content.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("REM"):
-            continue
-        match = re.match(r'^"([^"]+python\.exe)"\s+main\.py\s*$', stripped, re.IGNORECASE)
-        if match:
-            candidate = match.group(1)
-            if Path(candidate).exists():
-                return candidate
-
     return ""
 
 
@@ -146,6 +147,17 @@ def _resolve_preferred_python() -> str:
     return sys.executable
 
 
+def _same_interpreter(first: str, second: str) -> bool:
+    """Compare interpreter paths lexically; only resolve when a symlink is involved."""
+    first_norm = os.path.normcase(os.path.abspath(first))
+    second_norm = os.path.normcase(os.path.abspath(second))
+    if first_norm == second_norm:
+        return True
+    if os.path.islink(first) or os.path.islink(second):
+        return os.path.normcase(os.path.realpath(first)) == os.path.normcase(os.path.realpath(second))
+    return False
+
+
 def _relaunch_with_python(python_exe: str) -> bool:
     """Launch selected Python interpreter in a new process.
 
@@ -164,6 +176,22 @@ def _relaunch_with_python(python_exe: str) -> bool:
         return False
 
 
+def _run_streaming(cmd: List[str]) -> int:
+    """Run a command, echoing its merged stdout/stderr line by line as it arrives."""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    assert process.stdout is not None
+    for line in process.stdout:
+        print(f"  {Colors.GRAY}{line.rstrip()}{Colors.RESET}")
+    process.stdout.close()
+    return process.wait()
+
+
 def _pip_install_yt_dlp(python_exe: str) -> bool:
     """Install yt-dlp into the current interpreter environment."""
     install_cmd = [python_exe, "-m", "pip", "install", "yt-dlp"]
@@ -176,68 +204,26 @@ def _pip_install_yt_dlp(python_exe: str) -> bool:
     try:
         print(f"{Colors.BLUE}Attempting to install yt-dlp using:{Colors.RESET}")
         print(f"  {Colors.GRAY}{' '.join(install_cmd)}{Colors.RESET}")
-        result = subprocess.run(install_cmd, capture_output=True, text=True, check=False)
-        if result.returncode == 0:
+        return_code = _run_streaming(install_cmd)
+        if return_code == 0:
             print(f"{Colors.GREEN}✓ yt-dlp installed successfully for this Python interpreter.{Colors.RESET}")
             return True
 
         # Try bootstrapping pip once, then retry install.
         ensurepip_cmd = [python_exe, "-m", "ensurepip", "--upgrade"]
-        ensurepip_result = subprocess.run(ensurepip_cmd, capture_output=True, text=True, check=False)
-        if ensurepip_result.returncode == 0:
-            retry = subprocess.run(install_cmd, capture_output=True, text=True, check=False)
-            if retry.returncode == 0:
+        if _run_streaming(ensurepip_cmd) == 0:
+            return_code = _run_streaming(install_cmd)
+            if return_code == 0:
                 print(f"{Colors.GREEN}✓ yt-dlp installed successfully after bootstrapping pip.{Colors.RESET}")
                 return True
-            result = retry
 
-        print(f"{Colors.RED}❌ Automatic install failed (exit code {result.returncode}).{Colors.RESET}")
-        if result.stdout.strip():
-            print(f"{Colors.YELLOW}Installer output:{Colors.RESET}\n{result.stdout.strip()}")
-        if result.stderr.strip():
-            print(f"{Colors.RED}Installer errors:{Colors.RESET}\n{result.stderr.strip()}")
+        print(f"{Colors.RED}❌ Automatic install failed (exit code {return_code}). See installer output above.{Colors.RESET}")
         return False
     except Exception as exc:
         print(f"{Colors.RED}❌ Failed to run installer: {exc}{Colors.RESET}")
         return False
 
 
-def safe_input(prompt: str, default: str = "", allow_escape: bool = False) -> str:
-    """Input wrapper that returns default on EOFError and strips whitespace."""
-    if allow_escape and os.name == "nt" and sys.stdin.isatty() and sys.stdout.isatty():
-        try:
-            import msvcrt  # type: ignore
-
-            print(prompt, end="", flush=True)
-            buffer: List[str] = []
-            while True:
-                ch = msvcrt.getwch()
-                if ch in ("\r", "\n"):
-                    print()
-                    value = ''.join(buffer).strip()
-                    return value or default
-                if ch == "\x1b":
-                    print()
-                    return ESCAPE_SENTINEL
-                if ch in ("\x08", "\x7f"):
-                    if buffer:
-                        buffer.pop()
-                        print("\b \b", end="", flush=True)
-                    continue
-                buffer.append(ch)
-                print(ch, end="", flush=True)
-        except Exception:
-            pass
-    try:
-        value = input(prompt)
-        value = value.strip()
-        if allow_escape and value == "\x1b":
-            return ESCAPE_SENTINEL
-        return value or default
-    except EOFError:
-        return default
-
-
 SIZE_TOKEN_RE = re.compile(r"(?P<value>[0-9]+(?:\.[0-9]+)?)(?P<unit>[KMGTP]?i?B)", re.IGNORECASE)
 CLI_PROGRESS_RE = re.compile(
     r"\[download\]\s+(?P<percent>[0-9]+(?:\.[0-9]+)?)%.*?of\s+(?P<total>\S+)\s+at\s+(?P<speed>\S+)\s+ETA\s+(?P<eta>\S+)",
@@ -369,6 +355,8 @@ def download_single_video(url: str, folder: Path, display_name: str) -> bool:
 
 
 def _download_single_video_with_api(yt_dlp_module: Any, url: str, folder: Path, display_name: str) -> bool:
+    from src.core.progress import ProgressBar, format_bytes, format_speed, format_eta
+
     safe_name = sanitize_filename(display_name) or "downloaded_track"
     output_template = str(folder / f"{safe_name}.%(ext)s")
 
@@ -415,6 +403,8 @@ def _download_single_video_with_api(yt_dlp_module: Any, url: str, folder: Path,
 
 def _download_single_video_cli(url: str, folder: Path, display_name: str) -> bool:
     """Fallback downloader using the yt-dlp CLI output (no fancy progress)."""
+    from src.core.progress import ProgressBar
+
     safe_name = sanitize_filename(display_name) or "downloaded_track"
     output_template = str(folder / f"{safe_name}.%(ext)s")
 
@@ -507,6 +497,8 @@ def _download_single_video_cli(url: str, folder: Path, display_name: str) -> boo
 
 def run_sync_mode(settings: Dict[str, Any]) -> None:
     """Synchronize all configured playlists in download-only mode."""
+    from src.core.downloader import PlaylistSyncer, PlaylistInfo, SyncMode
+
     playlists = settings.get("playlists", [])
     if not playlists:
         print(f"\n{Colors.YELLOW}No playlists configured.{Colors.RESET}")
@@ -580,16 +572,8 @@ def main() -> None:
 
     preferred_python = _resolve_preferred_python()
     current_python = sys.executable
-    try:
-        preferred_resolved = str(Path(preferred_python).resolve())
-    except Exception:
-        preferred_resolved = preferred_python
-    try:
-        current_resolved = str(Path(current_python).resolve())
-    except Exception:
-        current_resolved = current_python
 
-    if preferred_resolved and preferred_resolved != current_resolved:
+    if preferred_python and not _same_interpreter(preferred_python, current_python):
         print(f"{Colors.YELLOW}⚠ Current Python: {current_python}{Colors.RESET}")
         print(f"{Colors.GREEN}✓ Preferred Python found: {preferred_python}{Colors.RESET}")
         switch_now = safe_input(
@@ -662,6 +646,8 @@ def main() -> None:
             continue
 
         if normalized_choice == "3":
+            from src.flows.single_flow import run_single_download_mode
+
             run_single_download_mode(settings)
             continue
 
@@ -677,6 +663,8 @@ def main() -> None:
                     settings = load_settings()
                 continue
 
+            from src.flows.sync_flow import run_sync_mode as run_sync_mode_flow
+
             run_sync_mode_flow(settings)
             continue
 
@@ -6,6 +6,6 @@ except Exception as e:
     print('yt_dlp import failed:', e)
 
 import shutil
-from pathlib import Path
+import sys
 print('where yt-dlp executable (PATH search):', shutil.which('yt-dlp'))
-print('where python is:', Path().resolve())
+print('where python is:', sys.executable)
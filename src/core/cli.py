@@ -4,38 +4,94 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import List
 
 ESCAPE_SENTINEL = "__SAFE_INPUT_ESC__"
 
 
+def _echo(text: str) -> None:
+    """Echo typed characters via the raw byte stream, bypassing print()'s text layer."""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    stream.write(text.encode("utf-8", errors="replace"))
+    stream.flush()
+
+
+def _push_console_key(ch: str) -> bool:
+    """Put a key read with getwch() back into the Windows console input buffer.
+
+    The console's line editor (which input() reads through) then receives it as
+    if typed: echoed, editable with Backspace and the arrow keys. msvcrt.ungetwch()
+    is not enough, as it only feeds getwch() and never reaches ReadConsoleW.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class KEY_EVENT_RECORD(ctypes.Structure):
+            _fields_ = [
+                ("bKeyDown", wintypes.BOOL),
+                ("wRepeatCount", wintypes.WORD),
+                ("wVirtualKeyCode", wintypes.WORD),
+                ("wVirtualScanCode", wintypes.WORD),
+                ("uChar", wintypes.WCHAR),
+                ("dwControlKeyState", wintypes.DWORD),
+            ]
+
+        class INPUT_RECORD(ctypes.Structure):
+            _fields_ = [("EventType", wintypes.WORD), ("Event", KEY_EVENT_RECORD)]
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        records = (INPUT_RECORD * 2)()
+        for record, key_down in zip(records, (True, False)):
+            record.EventType = 0x0001  # KEY_EVENT
+            record.Event.bKeyDown = key_down
+            record.Event.wRepeatCount = 1
+            record.Event.uChar = ch
+        written = wintypes.DWORD()
+        ok = kernel32.WriteConsoleInputW(handle, records, len(records), ctypes.byref(written))
+        return bool(ok) and written.value == len(records)
+    except Exception:
+        return False
+
+
 def safe_input(prompt: str, default: str = "", allow_escape: bool = False) -> str:
     """Input wrapper that returns default on EOFError and strips whitespace.
 
-    On Windows terminals, when allow_escape=True, supports cancelling with ESC.
+    On Windows terminals, when allow_escape=True, supports cancelling with ESC as
+    the first key; after that, ESC clears the line as usual in the console.
     """
     if allow_escape and os.name == "nt" and sys.stdin.isatty() and sys.stdout.isatty():
         try:
             import msvcrt  # type: ignore
 
             print(prompt, end="", flush=True)
-            buffer: List[str] = []
-            while True:
-                ch = msvcrt.getwch()
-                if ch in ("\r", "\n"):
-                    print()
-                    value = "".join(buffer).strip()
-                    return value or default
-                if ch == "\x1b":
-                    print()
-                    return ESCAPE_SENTINEL
-                if ch in ("\x08", "\x7f"):
-                    if buffer:
-                        buffer.pop()
-                        print("\b \b", end="", flush=True)
-                    continue
-                buffer.append(ch)
-                print(ch, end="", flush=True)
+            # Only the first key is read raw, to catch ESC; the rest of the line goes
+            # through input(), so the console does the echo, editing and paste.
+            ch = msvcrt.getwch()
+            if ch == "\x1b":
+                print()
+                return ESCAPE_SENTINEL
+            if ch in ("\r", "\n"):
+                print()
+                return default
+            prefix = ""
+            if ch in ("\x00", "\xe0"):
+                msvcrt.getwch()  # second half of an arrow/function key; a no-op on an empty line
+            elif ch.isprintable() and not _push_console_key(ch):
+                # Could not hand the key back to the console: keep it, though it can't be edited.
+                _echo(ch)
+                prefix = ch
+            # Backspace and other control keys on an empty line are dropped, as the console would.
+            value = (prefix + input()).strip()
+            if value == "\x1b":
+                return ESCAPE_SENTINEL
+            return value or default
+        except EOFError:
+            return default
         except Exception:
             # Fall back to normal input
             pass
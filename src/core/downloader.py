@@ -2,15 +2,20 @@
 YouTube Playlist Downloader Module
 """
 
+import hashlib
 import json
+import locale
 import os
 import re
 import subprocess
+import threading
 import time
+import unicodedata
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Set, Tuple, Optional, Generator, Callable
 from dataclasses import dataclass
@@ -20,7 +25,8 @@ import sys
 
 from src.ui.colors import Colors
 from src.core.progress import ProgressBar
-from src.core.metadata import MetadataManager, FileNameFormatter
+from src.core.metadata import FileNameFormatter, get_metadata_manager
+from src.core.state import get_listing_fingerprint, set_listing_fingerprint
 from src.core.utils import (
     COOKIES_FILE,
     AUDIO_EXTENSIONS,
@@ -32,12 +38,68 @@ from src.core.utils import (
     ytdlp_common_flags,
     normalize_url,
     is_probably_url,
+    iter_byte_lines_with_deadline,
+    spawn_probe,
+    YTDLP_CMD,
 )
 
+try:
+    from orjson import loads as _json_loads  # optional, several times faster on large listings
+except ImportError:
+    _json_loads = json.loads
+
+# "ERROR: [extractor] <video id>: reason" lines from yt-dlp's download output
+_RE_VIDEO_ERROR = re.compile(r"ERROR:\s+\[[^\]]+\]\s+([A-Za-z0-9_-]{11}):\s+(.*)")
+# Video ID in a watch?v= or youtu.be/ URL
+_RE_URL_VIDEO_ID = re.compile(r"(?:[?&]v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+# downloaded.txt line: "extractor <video id>", else the first 11-char ID token on the line
+_RE_ARCHIVE_ID = re.compile(
+    rb"(?m)^[ \t]*\S+[ \t]+([A-Za-z0-9_-]{11})(?=\s|$)|^.*?\b([A-Za-z0-9_-]{11})\b"
+)
+# Trailing duplicate markers, stacked ones included: (dup), (copy), (N), [dup], [copy] or [N]
+_RE_DUP_MARKER = re.compile(r"(?:\s*(?:\((?:dup|copy|\d+)\)|\[(?:dup|copy|\d+)\]))+\s*$", re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r"\s+")
+# yt-dlp leftovers removed by cleanup (batch_*.txt files from older runs are matched by name)
+_TEMP_EXTENSIONS = frozenset({".part", ".ytdl", ".tmp"})
+# Runs of non-word characters (and underscores) dropped by normalize_name
+_RE_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+# ASCII fast path for normalize_name: drop everything except [a-z0-9] after lower()
+_ASCII_DROP = str.maketrans("", "", "".join(
+    ch for ch in map(chr, range(128)) if not (ch.isdigit() or "a" <= ch <= "z")
+))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(name: str) -> str:
+    if name.isascii():
+        # NFKD is the identity on ASCII and there are no combining marks to drop
+        return name.lower().translate(_ASCII_DROP)
+    # Normalize unicode and remove combining marks (diacritics)
+    norm = unicodedata.normalize('NFKD', name)
+    norm = ''.join(ch for ch in norm if not unicodedata.combining(ch))
+    norm = norm.lower()
+    # Remove any non-word characters (keeps unicode letters and digits), then drop underscores
+    return _RE_NON_WORD.sub('', norm)
+
 # Configure logging (use stdout so PowerShell piping stays clean)
 logging.basicConfig(stream=sys.stdout, level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _iter_output_lines(stream) -> Generator[bytes, None, None]:
+    """Raw output lines without their terminators.
+
+    Also splits on bare carriage returns, which yt-dlp uses for in-place
+    progress updates when --newline is off (debug runs).
+    """
+    for raw in stream:
+        raw = raw.rstrip(b"\r\n")
+        if b"\r" in raw:
+            yield from raw.split(b"\r")
+        else:
+            yield raw
+
+
 class SyncMode(Enum):
     """Sync modes for playlist synchronization"""
     DOWNLOAD_ONLY = "download"
@@ -60,6 +122,16 @@ class VideoInfo:
     metadata: Dict[str, str]
     url: str
 
+    @cached_property
+    def clean_name(self) -> str:
+        """Formatted "Artist - Title" name, computed once per video."""
+        return FileNameFormatter.format_filename(self.metadata)
+
+    @cached_property
+    def normalized_name(self) -> str:
+        """clean_name normalized for duplicate detection."""
+        return FileProcessor.normalize_name(self.clean_name)
+
 @dataclass
 class DownloadFailure:
     """Represents a single video yt-dlp could not download"""
@@ -75,6 +147,8 @@ class DownloadResult:
     downloaded: int = 0
     skipped_archive: int = 0
     skipped_existing: int = 0
+    # yt-dlp's exit status; None when it never ran to completion
+    returncode: Optional[int] = 0
 
 class DownloadError(Exception):
     """Custom exception for download errors"""
@@ -88,13 +162,19 @@ class YTDLPWrapper:
     """Wrapper for yt-dlp commands with better error handling"""
     
     @staticmethod
-    def get_playlist_info(url: str, timeout: int = 30) -> Optional[Dict[str, Any]]:
-        """Get playlist information from yt-dlp"""
+    def get_playlist_info(url: str, timeout: int = 30, quiet: bool = False) -> Optional[Dict[str, Any]]:
+        """Get playlist information from yt-dlp
+
+        The flat listing is read as one JSON document and parsed straight from the
+        bytes. Returns None unless the URL resolves to a playlist: a single video
+        must never look like a one-entry playlist, or every other file in the
+        folder would be treated as removed. quiet=True logs failures at debug level.
+        """
+        log_error = logger.debug if quiet else logger.error
+        line = b""
         try:
             cmd = [
-                sys.executable,
-                "-m",
-                "yt_dlp",
+                *YTDLP_CMD,
                 "--remote-components", "ejs:github",
                 "--flat-playlist",
                 "--dump-single-json",
@@ -103,31 +183,32 @@ class YTDLPWrapper:
                 url
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False
-            )
+            process = spawn_probe(cmd, stderr=subprocess.PIPE)
+            stderr_chunks: List[bytes] = []
+            line = b"".join(iter_byte_lines_with_deadline(process, timeout, stderr_chunks))
             
-            if result.returncode != 0:
-                error_message = result.stderr if result.stderr else "(no error message)"
-                logger.error(f"yt-dlp failed with error: {error_message}")
+            if process.returncode != 0:
+                error_message = b"".join(stderr_chunks).decode(errors="replace") or "(no error message)"
+                log_error(f"yt-dlp failed with error: {error_message}")
                 return None
-                
-            return json.loads(result.stdout) if result.stdout else None
+            if not line.strip():
+                return None
+            
+            playlist_data = _json_loads(line)
+            if not isinstance(playlist_data, dict) or playlist_data.get("_type") != "playlist":
+                log_error(f"Not a playlist URL: {url}")
+                return None
+            return playlist_data
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Timeout getting playlist info for {url}")
+            log_error(f"Timeout getting playlist info for {url}")
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse yt-dlp output: {e}")
-            if result.stdout:
-                logger.debug(f"Raw output was {len(result.stdout)} chars: {result.stdout[:300]}...")
+            log_error(f"Failed to parse yt-dlp output: {e}")
+            logger.debug(f"Raw output was {len(line)} chars: {line[:300]}...")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error getting playlist info: {e}")
+            log_error(f"Unexpected error getting playlist info: {e}")
             return None
     
     @staticmethod
@@ -138,25 +219,27 @@ class YTDLPWrapper:
         progress_callback: Optional[Callable[[int], None]] = None,
         debug: bool = False,
         log_file_path: Optional[Path] = None,
+        before_spawn: Optional[Callable[[], None]] = None,
     ) -> DownloadResult:
-        """Download multiple videos using yt-dlp and capture errors"""
+        """Download multiple videos using yt-dlp and capture errors
+
+        before_spawn, if given, runs right before yt-dlp starts (and reads the archive).
+        """
         if not video_urls:
             return DownloadResult(success=True, failures=[], downloaded=0, skipped_archive=0, skipped_existing=0)
             
-        batch_file = output_dir / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         log_file = None
         lf = None
         failures: List[DownloadFailure] = []
         seen_failure_ids: Set[str] = set()
         
         try:
-            # Write video URLs to batch file
-            with open(batch_file, "w", encoding="utf-8") as f:
-                for url in video_urls:
-                    f.write(f"{url}\n")
+            output_dir.mkdir(parents=True, exist_ok=True)
+            # The batch is fed to yt-dlp on stdin ("-a -") rather than through a temp file
+            batch = "".join(f"{url}\n" for url in video_urls).encode("utf-8")
             
             # Build command
-            cmd = [sys.executable, "-m", "yt_dlp"]
+            cmd = [*YTDLP_CMD]
 
             runtime = detected_js_runtime()
             if runtime:
@@ -180,7 +263,7 @@ class YTDLPWrapper:
                 "--no-playlist",  # Ensure we only download individual videos
                 "-P", str(output_dir),
                 "-o", "%(title)s [%(id)s].%(ext)s",
-                "-a", str(batch_file),
+                "-a", "-",
             ])
             
             # Add cookies if available (COOKIES_FILE is a string path)
@@ -193,69 +276,107 @@ class YTDLPWrapper:
                 log_file = log_file_path or (output_dir / "yt-dlp-debug.log")
                 log_file.parent.mkdir(parents=True, exist_ok=True)
                 try:
-                    lf = open(log_file, "a", encoding="utf-8")
-                    lf.write(f"---- yt-dlp run: {datetime.now().isoformat()} ----\n")
-                    lf.write("Command: " + ' '.join(cmd) + "\n")
+                    # Binary: yt-dlp's output lines are logged as the raw bytes it wrote
+                    lf = open(log_file, "ab")
+                    header = f"---- yt-dlp run: {datetime.now().isoformat()} ----\nCommand: {' '.join(cmd)}\nBatch:\n"
+                    lf.write(header.encode("utf-8", "replace") + batch)
                     lf.flush()
                 except Exception as e:
                     logger.warning(f"Could not open debug log: {e}")
 
-            # Run download
+            if before_spawn:
+                before_spawn()
+
+            # Run download (binary pipe: most lines only need byte substring checks)
             process = subprocess.Popen(
                 cmd,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=64 * 1024,
             )
+
+            def feed_batch() -> None:
+                # Own thread, so a batch larger than the pipe buffer can't stall
+                # against output waiting to be read below.
+                try:
+                    process.stdin.write(batch)
+                except OSError:
+                    pass  # yt-dlp exited early; its output says why
+                finally:
+                    try:
+                        process.stdin.close()
+                    except OSError:
+                        pass
+
+            threading.Thread(target=feed_batch, daemon=True).start()
+            encoding = locale.getpreferredencoding(False)
             
+            # Failure lines name a video ID; map IDs back to their URLs without rescanning the list.
+            url_by_id: Dict[str, str] = {}
+            for video_url in video_urls:
+                id_match = _RE_URL_VIDEO_ID.search(video_url)
+                if id_match:
+                    url_by_id.setdefault(id_match.group(1), video_url)
+
             # Process output for progress tracking
             processed_count = 0
             downloaded_count = 0
             skipped_archive = 0
             skipped_existing = 0
-            for line in process.stdout:
-                line = line.rstrip("\n")
-                if not line:
+            # Debug log flushes are batched: every 64 lines or once a second
+            unflushed = 0
+            last_flush = time.monotonic()
+            for raw in _iter_output_lines(process.stdout):
+                if not raw:
                     continue
 
                 # Write full output to debug log when enabled
                 if lf:
                     try:
-                        lf.write(line + "\n")
-                        lf.flush()
+                        lf.write(raw + b"\n")
+                        unflushed += 1
+                        if unflushed >= 64 or time.monotonic() - last_flush >= 1.0:
+                            lf.flush()
+                            unflushed = 0
+                            last_flush = time.monotonic()
                     except Exception:
                         pass
 
-                # Track outcomes and progress.
-                lower = line.lower()
-                if "has already been recorded in the archive" in lower:
+                # Track outcomes and progress (yt-dlp emits these phrases in fixed case).
+                if b"has already been recorded in the archive" in raw:
                     skipped_archive += 1
                     processed_count += 1
                     if progress_callback:
                         progress_callback(processed_count)
-                elif "has already been downloaded" in lower:
+                elif b"has already been downloaded" in raw:
                     skipped_existing += 1
                     processed_count += 1
                     if progress_callback:
                         progress_callback(processed_count)
-                elif "[download] 100%" in line:
+                elif b"[download] 100%" in raw:
                     downloaded_count += 1
                     processed_count += 1
                     if progress_callback:
                         progress_callback(processed_count)
-                        
+
+                # Only error lines are decoded; progress output stays as bytes.
+                # "[error]" tags can come in any case, so match on the case-folded line.
+                is_logged_error = b"[error]" in raw.lower()
+                if not is_logged_error and b"ERROR:" not in raw:
+                    continue
+                line = raw.decode(encoding, "replace")
+
                 # Log errors
-                if "[error]" in line.lower():
+                if is_logged_error:
                     logger.error(f"yt-dlp error: {line}")
 
-                error_match = re.search(r"ERROR:\s+\[[^\]]+\]\s+([A-Za-z0-9_-]{11}):\s+(.*)", line)
+                error_match = _RE_VIDEO_ERROR.search(line)
                 if error_match:
                     video_id = error_match.group(1)
                     if video_id not in seen_failure_ids:
                         reason = error_match.group(2).strip()
-                        url = next((url for url in video_urls if video_id in url), "")
+                        url = url_by_id.get(video_id) or next((u for u in video_urls if video_id in u), "")
                         failures.append(DownloadFailure(video_id=video_id, url=url, reason=reason))
                         seen_failure_ids.add(video_id)
             
@@ -264,14 +385,16 @@ class YTDLPWrapper:
             # If debug, record return code and a brief directory listing
             if lf:
                 try:
-                    lf.write(f"Return code: {process.returncode}\n")
-                    lf.write("Contents:\n")
-                    for p in sorted(output_dir.iterdir()):
+                    trailer = [f"Return code: {process.returncode}\n", "Contents:\n"]
+                    with os.scandir(output_dir) as it:
+                        entries = sorted(it, key=lambda e: e.name)
+                    for entry in entries:
                         try:
-                            lf.write(f"{p.name}  {p.stat().st_size}\n")
-                        except Exception:
-                            lf.write(f"{p.name}\n")
-                    lf.write("---- end run ----\n\n")
+                            trailer.append(f"{entry.name}  {entry.stat().st_size}\n")
+                        except OSError:
+                            trailer.append(f"{entry.name}\n")
+                    trailer.append("---- end run ----\n\n")
+                    lf.write("".join(trailer).encode("utf-8", "replace"))
                     lf.flush()
                 except Exception:
                     pass
@@ -287,6 +410,7 @@ class YTDLPWrapper:
                 downloaded=downloaded_count,
                 skipped_archive=skipped_archive,
                 skipped_existing=skipped_existing,
+                returncode=process.returncode,
             )
             
         except Exception as e:
@@ -295,19 +419,14 @@ class YTDLPWrapper:
                 failures.append(DownloadFailure(video_id="", url="", reason=str(e)))
             if lf:
                 try:
-                    lf.write(f"Exception: {e}\n")
+                    lf.write(f"Exception: {e}\n".encode("utf-8", "replace"))
                     lf.flush()
                     lf.close()
                 except Exception:
                     pass
-            return DownloadResult(success=False, failures=failures, downloaded=0, skipped_archive=0, skipped_existing=0)
-        finally:
-            # Clean up batch file unless debugging (keep for inspection)
-            try:
-                if batch_file.exists() and not debug:
-                    batch_file.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to delete batch file: {e}")
+            return DownloadResult(
+                success=False, failures=failures, downloaded=0, skipped_archive=0, skipped_existing=0, returncode=None
+            )
 
 class FileProcessor:
     """Handles file operations and duplicate detection"""
@@ -320,37 +439,20 @@ class FileProcessor:
         falling back to removing non-word characters. Avoid returning an empty
         string when possible to prevent accidental mass-matching.
         """
-        import unicodedata
         if not name:
             return ""
-        # Normalize unicode and remove combining marks (diacritics)
-        norm = unicodedata.normalize('NFKD', name)
-        norm = ''.join(ch for ch in norm if not unicodedata.combining(ch))
-        norm = norm.lower()
-        # Remove any non-word characters (keeps unicode letters and digits), then drop underscores
-        norm = re.sub(r'[\W_]+', '', norm, flags=re.UNICODE)
-        return norm
+        # Pure function of the name; the same titles recur across files and listings
+        return _normalize_cached(name)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clean_filename(filename: str) -> str:
         """Clean filename by removing duplicate markers and extra spaces"""
-        cleaned = filename
-        
         # Remove duplicate markers
-        patterns = [
-            r'\s*\(dup\)\s*$',
-            r'\s*\(copy\)\s*$',
-            r'\s*\(\d+\)\s*$',
-            r'\s*\[dup\]\s*$',
-            r'\s*\[copy\]\s*$',
-            r'\s*\[\d+\]\s*$'
-        ]
-        
-        for pattern in patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = _RE_DUP_MARKER.sub('', filename)
         
         # Remove multiple spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _RE_WHITESPACE.sub(' ', cleaned).strip()
         
         return cleaned
     
@@ -363,29 +465,40 @@ class FileProcessor:
     @staticmethod
     def get_audio_files(folder: Path) -> List[Path]:
         """Get all audio files in a folder"""
-        audio_files: Set[Path] = set()
-        for ext in AUDIO_EXTENSIONS:
-            for file in folder.glob(f"*{ext}"):
-                audio_files.add(file)
-            for file in folder.glob(f"*{ext.upper()}"):
-                audio_files.add(file)
+        # One directory read with a set lookup per entry (any extension case),
+        # rather than two globs per extension.
+        audio_files: List[Path] = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS and entry.is_file():
+                        audio_files.append(Path(entry.path))
+        except FileNotFoundError:
+            return []
         return sorted(audio_files)
     
     @staticmethod
-    def get_recent_files(files: List[Path], minutes: int = 10) -> List[Path]:
-        """Get files modified in the last X minutes"""
-        now = time.time()
-        threshold = now - (minutes * 60)
-        
-        recent_files = []
-        for file in files:
-            try:
-                if file.stat().st_mtime >= threshold:
-                    recent_files.append(file)
-            except OSError:
-                continue
-        
-        return recent_files
+    def get_recent_audio_files(folder: Path, minutes: int = 10) -> List[Path]:
+        """Audio files in a folder modified in the last X minutes, in one directory read.
+
+        DirEntry.stat() is served from the directory listing on Windows, so the
+        recency filter costs no extra call per file there.
+        """
+        threshold = time.time() - (minutes * 60)
+        recent_files: List[Path] = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if os.path.splitext(entry.name)[1].lower() not in AUDIO_EXTENSIONS:
+                        continue
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime >= threshold:
+                            recent_files.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            return []
+        return sorted(recent_files)
 
 class PlaylistSyncer:
     """Enhanced playlist synchronization with better performance and error handling"""
@@ -393,12 +506,22 @@ class PlaylistSyncer:
     def __init__(self, playlist: PlaylistInfo, settings: Dict[str, Any]):
         self.playlist = playlist
         self.settings = settings
-        self.metadata_manager = MetadataManager()
+        self.metadata_manager = get_metadata_manager()
         self.ytdlp = YTDLPWrapper()
         self.file_processor = FileProcessor()
+        # Listing fetched ahead of time by fetch_remote_listing(), consumed by the next scan
+        self._remote_listing: Optional[Dict[str, Any]] = None
+        # Whether that listing's metadata has already been prefetched
+        self._listing_prefetched = False
+        # Hash of the video IDs from the most recent scan (see _listing_fingerprint)
+        self._last_ids_hash: Optional[str] = None
+        # (video ID, file stem) -> (formatted name, normalized name); cleared per sync()
+        self._file_names: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        # (folder mtime_ns, audio file listing) reused until the folder changes; see _audio_files
+        self._audio_cache: Optional[Tuple[int, List[Path]]] = None
         
-        # Ensure playlist folder exists
-        self.playlist.folder.mkdir(parents=True, exist_ok=True)
+        # The playlist folder is created on first write (see YTDLPWrapper.download_videos);
+        # scans treat a missing folder as empty.
         self.archive_file = self.playlist.folder / "downloaded.txt"
     
     @contextmanager
@@ -418,12 +541,7 @@ class PlaylistSyncer:
 
     def get_disk_video_ids(self) -> Set[str]:
         """Video IDs present on disk (filenames)."""
-        disk_ids: Set[str] = set()
-        for file in self.file_processor.get_audio_files(self.playlist.folder):
-            video_id = self.file_processor.extract_video_id(file.name)
-            if video_id:
-                disk_ids.add(video_id)
-        return disk_ids
+        return self._scan_disk_ids()[0]
 
     def get_archive_video_ids(self) -> Set[str]:
         """Video IDs recorded in yt-dlp's download archive (downloaded.txt).
@@ -436,59 +554,16 @@ class PlaylistSyncer:
             return archive_ids
 
         try:
-            with open(self.archive_file, "r", encoding="utf-8") as f:
-                for raw in f:
-                    line = raw.strip()
-                    if not line:
-                        continue
-
-                    parts = line.split()
-                    if len(parts) >= 2 and re.fullmatch(r"[A-Za-z0-9_-]{11}", parts[1]):
-                        archive_ids.add(parts[1])
-                        continue
-
-                    match = re.search(r"\b([A-Za-z0-9_-]{11})\b", line)
-                    if match:
-                        archive_ids.add(match.group(1))
+            with open(self.archive_file, "rb") as f:
+                data = f.read()
+            # One scan over the whole buffer; each line yields at most one ID
+            for primary, fallback in _RE_ARCHIVE_ID.findall(data):
+                archive_ids.add((primary or fallback).decode("ascii"))
         except Exception as e:
             logger.warning(f"Failed to read archive file: {e}")
 
         return archive_ids
 
-    def _prune_archive_for_videos(self, videos: List[VideoInfo]) -> int:
-        """Remove archive entries for the given video IDs so yt-dlp will re-download them."""
-        if not videos or not self.archive_file.exists():
-            return 0
-
-        ids_to_prune = {v.id for v in videos if v.id}
-        if not ids_to_prune:
-            return 0
-
-        try:
-            with open(self.archive_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            kept: List[str] = []
-            removed = 0
-            for line in lines:
-                stripped = line.strip()
-                if not stripped:
-                    kept.append(line)
-                    continue
-
-                if any(video_id in stripped for video_id in ids_to_prune):
-                    removed += 1
-                    continue
-                kept.append(line)
-
-            if removed:
-                with open(self.archive_file, "w", encoding="utf-8") as f:
-                    f.writelines(kept)
-            return removed
-        except Exception as e:
-            logger.warning(f"Failed to prune archive file: {e}")
-            return 0
-
     def _prune_archive_ids(self, video_ids: Set[str]) -> int:
         """Remove archive entries for the given video IDs so yt-dlp will re-download them.
 
@@ -500,6 +575,8 @@ class PlaylistSyncer:
         ids_to_prune = {vid.strip() for vid in video_ids if isinstance(vid, str) and vid.strip()}
         if not ids_to_prune:
             return 0
+        # One alternation for the fallback instead of a search per ID per line
+        id_token = re.compile(r"\b(?:" + "|".join(map(re.escape, ids_to_prune)) + r")\b")
 
         try:
             with open(self.archive_file, "r", encoding="utf-8") as f:
@@ -520,7 +597,7 @@ class PlaylistSyncer:
                     continue
 
                 # Fallback: prune if any ID token appears in the line
-                if any(re.search(rf"\b{re.escape(vid)}\b", stripped) for vid in ids_to_prune):
+                if id_token.search(stripped):
                     removed += 1
                     continue
 
@@ -536,33 +613,151 @@ class PlaylistSyncer:
     
     def get_existing_song_names(self) -> Set[str]:
         """Get normalized song names from existing files"""
-        existing_songs = set()
-        
-        for file in self.file_processor.get_audio_files(self.playlist.folder):
-            try:
-                # Extract video ID
-                video_id = self.file_processor.extract_video_id(file.name)
-                
-                # Get metadata
-                metadata = self.metadata_manager.get_metadata(
-                    video_id or "", 
-                    file.stem
-                )
-                
-                # Format and normalize
-                clean_name = FileNameFormatter.format_filename(metadata)
-                normalized = self.file_processor.normalize_name(clean_name)
-                existing_songs.add(normalized)
-                
-            except Exception as e:
-                logger.warning(f"Failed to process {file.name}: {e}")
-                # Fallback to filename
-                clean_name = self.file_processor.clean_filename(file.stem)
-                normalized = self.file_processor.normalize_name(clean_name)
-                existing_songs.add(normalized)
-        
+        return self._scan_folder()[1]
+
+    def _audio_files(self) -> List[Path]:
+        """Audio files in the playlist folder, re-listed only when the folder changes.
+
+        The folder's mtime moves on every add, remove or rename, so one stat
+        validates the cached listing; our own renames and moves also drop it
+        explicitly (coarse-mtime filesystems). Callers must not mutate the list.
+        """
+        try:
+            stamp = self.playlist.folder.stat().st_mtime_ns
+        except OSError:
+            self._audio_cache = None
+            return []
+        if self._audio_cache is None or self._audio_cache[0] != stamp:
+            self._audio_cache = (stamp, self.file_processor.get_audio_files(self.playlist.folder))
+        return self._audio_cache[1]
+
+    def _max_workers(self) -> int:
+        try:
+            max_workers = int(self.settings.get("max_workers", 4))
+        except Exception:
+            max_workers = 4
+        return max(1, max_workers)
+
+    def _scan_folder(self) -> Tuple[Set[str], Set[str]]:
+        """One pass over the folder: (video IDs from filenames, normalized song names)."""
+        disk_ids, files = self._scan_disk_ids()
+        return disk_ids, self._song_names(files)
+
+    def _scan_disk_ids(self) -> Tuple[Set[str], List[Tuple[Path, Optional[str]]]]:
+        """Cheap half of the scan: video IDs from filenames, plus (file, video ID) pairs."""
+        disk_ids: Set[str] = set()
+        files: List[Tuple[Path, Optional[str]]] = []
+        for file in self._audio_files():
+            video_id = self.file_processor.extract_video_id(file.name)
+            if video_id:
+                disk_ids.add(video_id)
+            files.append((file, video_id))
+        return disk_ids, files
+
+    def _song_names(self, files: List[Tuple[Path, Optional[str]]]) -> Set[str]:
+        """Expensive half of the scan: normalized song names for the given files."""
+        existing_songs: Set[str] = set()
+        # Metadata lookups may hit disk or yt-dlp; run them in parallel like the listing
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            futures = [executor.submit(self._existing_song_name, file, video_id) for file, video_id in files]
+            for future in as_completed(futures):
+                existing_songs.add(future.result())
         return existing_songs
+
+    def _file_name_info(self, file: Path, video_id: Optional[str]) -> Tuple[str, str]:
+        """(formatted name, normalized name) for a file on disk, memoized for the run.
+
+        The duplicate check, organize pass and orphan removal all look at the same
+        files, so metadata lookup and formatting run once per file.
+        """
+        key = (video_id or "", file.stem)
+        cached = self._file_names.get(key)
+        if cached is None:
+            metadata = self.metadata_manager.get_metadata(video_id or "", file.stem)
+            clean_name = FileNameFormatter.format_filename(metadata)
+            cached = (clean_name, self.file_processor.normalize_name(clean_name))
+            self._file_names[key] = cached
+        return cached
+
+    def _existing_song_name(self, file: Path, video_id: Optional[str]) -> str:
+        """Normalized song name for one file on disk"""
+        try:
+            return self._file_name_info(file, video_id)[1]
+            
+        except Exception as e:
+            logger.warning(f"Failed to process {file.name}: {e}")
+            # Fallback to filename
+            clean_name = self.file_processor.clean_filename(file.stem)
+            return self.file_processor.normalize_name(clean_name)
     
+    @staticmethod
+    def _ids_hash(entries: List[Any]) -> str:
+        ids = sorted(entry["id"] for entry in entries if isinstance(entry, dict) and entry.get("id"))
+        return hashlib.blake2b("\n".join(ids).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _listing_fingerprint(self, ids_hash: str) -> Dict[str, Any]:
+        """Remote IDs plus the folder's mtime (which moves whenever files are added,
+        removed or renamed), so an unchanged fingerprint means nothing to do."""
+        return {"ids_hash": ids_hash, "folder_mtime_ns": self.playlist.folder.stat().st_mtime_ns}
+
+    def _state_key(self) -> str:
+        return f"{normalize_url(self.playlist.url)}|{self.playlist.folder}"
+
+    def is_up_to_date(self) -> bool:
+        """True if the remote listing and the local folder both match the last successful sync."""
+        recorded = get_listing_fingerprint(self._state_key())
+        if not recorded:
+            return False
+        # The flat listing is enough to compare IDs; no metadata prefetch yet.
+        listing = self._remote_listing or self._fetch_listing()
+        entries = listing.get("entries") if listing else None
+        if not entries:
+            return False
+        try:
+            return recorded == self._listing_fingerprint(self._ids_hash(entries))
+        except OSError:
+            return False
+
+    def _all_present(self, videos: List[VideoInfo]) -> bool:
+        """True if every video is on disk or recorded in the download archive."""
+        if not videos:
+            return True
+        present = self.get_disk_video_ids() | self.get_archive_video_ids()
+        return all(video.id in present for video in videos)
+
+    @staticmethod
+    def _entry_titles(entries: List[Any]) -> Dict[str, str]:
+        return {
+            entry["id"]: str(entry.get("title", "(No title)"))
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("id")
+        }
+
+    def _fetch_listing(self, quiet: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch the flat playlist listing and keep it for the next scan."""
+        url = normalize_url(self.playlist.url)
+        if not is_probably_url(url):
+            return None
+        playlist_data = self.ytdlp.get_playlist_info(url, quiet=quiet)
+        if playlist_data:
+            self._remote_listing = playlist_data
+            self._listing_prefetched = False
+        return playlist_data
+
+    def fetch_remote_listing(self) -> Optional[Dict[str, Any]]:
+        """Fetch the playlist listing and warm the metadata cache ahead of a sync.
+
+        Prints nothing (listing errors go to the debug log), so it can run while
+        another playlist is syncing; the next get_playlist_videos() call uses the
+        result instead of scanning again, and reports any error itself.
+        The metadata prefetch is skipped when the playlist is already up to date.
+        """
+        playlist_data = self._fetch_listing(quiet=True)
+        if playlist_data and not self.is_up_to_date():
+            self.metadata_manager.prefetch(self._entry_titles(playlist_data.get("entries", [])), self._max_workers())
+            self._listing_prefetched = True
+        return playlist_data
+
     def get_playlist_videos(self) -> List[VideoInfo]:
         """Get all videos from playlist with metadata"""
         with self.operation_context("playlist scan"):
@@ -576,7 +771,10 @@ class PlaylistSyncer:
                 print(f"{Colors.RED}❌ Invalid playlist URL: {self.playlist.url}{Colors.RESET}")
                 raise DownloadError("Invalid playlist URL")
             
-            playlist_data = self.ytdlp.get_playlist_info(self.playlist.url)
+            prefetched = self._remote_listing is not None and self._listing_prefetched
+            playlist_data = self._remote_listing or self.ytdlp.get_playlist_info(self.playlist.url)
+            self._remote_listing = None
+            self._listing_prefetched = False
             if not playlist_data:
                 print(f"{Colors.RED}❌ Failed to scan playlist{Colors.RESET}")
                 raise DownloadError("Failed to scan playlist")
@@ -589,15 +787,16 @@ class PlaylistSyncer:
             if not entries:
                 print(f"{Colors.RED}❌ No playlist entries found. Is this a real playlist URL?{Colors.RESET}")
                 raise DownloadError("Playlist contained no entries")
+            self._last_ids_hash = self._ids_hash(entries)
             
-            # Process entries in parallel for better performance
-            try:
-                max_workers = int(self.settings.get("max_workers", 4))
-            except Exception:
-                max_workers = 4
-            max_workers = max(1, max_workers)
+            # Resolve metadata for uncached entries in one yt-dlp run up front
+            # (already done if the listing was prefetched); anything it misses
+            # falls back to per-video lookups below.
+            if not prefetched:
+                self.metadata_manager.prefetch(self._entry_titles(entries), self._max_workers())
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Process entries in parallel for better performance
+            with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
                 futures = []
                 for entry in entries:
                     if entry and isinstance(entry, dict):
@@ -641,37 +840,35 @@ class PlaylistSyncer:
             return []
         
         with self.operation_context("duplicate check"):
-            disk_ids = self.get_disk_video_ids()
-            archive_ids = self.get_archive_video_ids()
-            existing_songs = self.get_existing_song_names()
-            
+            disk_ids, files = self._scan_disk_ids()
             print(f"{Colors.GRAY}✓ Already have {len(disk_ids)} songs on disk by video ID{Colors.RESET}")
+            
+            # Everything matched by ID: skip the archive read and the metadata pass
+            remaining = [video for video in all_videos if video.id not in disk_ids]
+            if not remaining:
+                return []
+            
+            archive_ids = self.get_archive_video_ids()
             stale_only = len(archive_ids - disk_ids)
             if stale_only:
                 print(
                     f"{Colors.YELLOW}⚠ Archive contains {stale_only} ID(s) not found on disk (will re-download if needed){Colors.RESET}"
                 )
+            existing_songs = self._song_names(files)
             print(f"{Colors.GRAY}✓ Already have {len(existing_songs)} unique songs by name{Colors.RESET}")
             
             new_videos = []
             duplicate_count = 0
             restore_from_archive = 0
             
-            for video in all_videos:
-                # Check by video ID
-                if video.id in disk_ids:
-                    continue
-
+            for video in remaining:
                 # If it was recorded in the archive but the file is missing locally,
                 # treat it as missing and allow re-download.
                 is_archive_only = bool(video.id in archive_ids)
                 
                 # Check by song name
-                clean_name = FileNameFormatter.format_filename(video.metadata)
-                normalized = self.file_processor.normalize_name(clean_name)
-                
-                if normalized in existing_songs:
-                    print(f"{Colors.YELLOW}⚠ Already have song (different video): {clean_name}{Colors.RESET}")
+                if video.normalized_name in existing_songs:
+                    print(f"{Colors.YELLOW}⚠ Already have song (different video): {video.clean_name}{Colors.RESET}")
                     duplicate_count += 1
                     continue
 
@@ -698,12 +895,20 @@ class PlaylistSyncer:
         with self.operation_context("download"):
             print(f"\n{Colors.MAGENTA}⬇ Downloading {len(videos)} new song(s)...{Colors.RESET}")
 
-            pruned = self._prune_archive_for_videos(videos)
-            if pruned:
-                print(
-                    f"{Colors.YELLOW}⚠ Pruned {pruned} stale archive entry/entries so missing files can be re-downloaded{Colors.RESET}"
-                )
-            
+            # If IDs are in yt-dlp's archive but missing locally, yt-dlp will skip them.
+            # Prune the target IDs so yt-dlp can re-download; the rewrite overlaps the
+            # batch-file setup and must finish before yt-dlp starts.
+            target_ids = {v.id for v in videos if v.id}
+            prune_pool = ThreadPoolExecutor(max_workers=1)
+            prune_future = prune_pool.submit(self._prune_archive_ids, target_ids)
+
+            def finish_prune() -> None:
+                pruned = prune_future.result()
+                if pruned:
+                    print(
+                        f"{Colors.YELLOW}⚠ Removed {pruned} stale ID(s) from downloaded.txt so yt-dlp can re-download missing files{Colors.RESET}"
+                    )
+
             video_urls = [video.url for video in videos]
             progress_bar = ProgressBar(total=len(videos), title="Downloading")
             
@@ -720,23 +925,19 @@ class PlaylistSyncer:
             else:
                 log_path = None
 
-            # If IDs are in yt-dlp's archive but missing locally, yt-dlp will skip them.
-            # Prune the target IDs so yt-dlp can re-download.
-            target_ids = {v.id for v in videos if v.id}
-            pruned = self._prune_archive_ids(target_ids)
-            if pruned:
-                print(
-                    f"{Colors.YELLOW}⚠ Removed {pruned} stale ID(s) from downloaded.txt so yt-dlp can re-download missing files{Colors.RESET}"
+            try:
+                result = self.ytdlp.download_videos(
+                    video_urls=video_urls,
+                    output_dir=self.playlist.folder,
+                    archive_file=self.archive_file,
+                    progress_callback=update_progress,
+                    debug=debug,
+                    log_file_path=log_path,
+                    before_spawn=finish_prune,
                 )
-
-            result = self.ytdlp.download_videos(
-                video_urls=video_urls,
-                output_dir=self.playlist.folder,
-                archive_file=self.archive_file,
-                progress_callback=update_progress,
-                debug=debug,
-                log_file_path=log_path,
-            )
+            finally:
+                prune_pool.shutdown(wait=True)
+                self._audio_cache = None  # yt-dlp added files
             if result.success:
                 details: List[str] = []
                 if result.downloaded:
@@ -760,7 +961,7 @@ class PlaylistSyncer:
         with self.operation_context("file organization"):
             print(f"\n{Colors.CYAN}🏷 Organizing files...{Colors.RESET}")
             
-            audio_files = self.file_processor.get_audio_files(self.playlist.folder)
+            audio_files = self._audio_files()
             if not audio_files:
                 print(f"{Colors.YELLOW}⏭ No audio files to organize{Colors.RESET}")
                 return (0, 0)
@@ -772,7 +973,7 @@ class PlaylistSyncer:
                     print(f"{Colors.YELLOW}⏭ Operation cancelled{Colors.RESET}")
                     return (0, 0)
             
-            used_names = {}
+            seen_normalized: Set[str] = set()
             renamed_count = 0
             duplicates_removed = 0
             
@@ -784,19 +985,13 @@ class PlaylistSyncer:
             for i, file in enumerate(audio_files, 1):
                 try:
                     video_id = self.file_processor.extract_video_id(file.name)
-                    metadata = self.metadata_manager.get_metadata(
-                        video_id or "", 
-                        file.stem
-                    )
-                    
-                    clean_name = FileNameFormatter.format_filename(metadata)
-                    normalized = self.file_processor.normalize_name(clean_name)
+                    clean_name, normalized = self._file_name_info(file, video_id)
                     
                     # DEBUG: Show what's happening
                     logger.debug(f"Processing: '{file.name}' -> clean: '{clean_name}' -> normalized: '{normalized}'")
                     
                     # Check for duplicates
-                    if normalized in used_names:
+                    if normalized in seen_normalized:
                         duplicates_removed += 1
                         print(f"\n{Colors.YELLOW}⚠ Duplicate detected: {clean_name} (norm: {normalized}){Colors.RESET}")
                         
@@ -813,7 +1008,7 @@ class PlaylistSyncer:
                                 print(f"  {Colors.RED}❌ Failed to quarantine, skipping: {file.name}{Colors.RESET}")
                         
                     else:
-                        used_names[normalized] = file  # Store the actual file for reference
+                        seen_normalized.add(normalized)
                         
                         # Check if renaming is needed
                         current_clean = self.file_processor.clean_filename(file.stem)
@@ -839,6 +1034,7 @@ class PlaylistSyncer:
                             else:
                                 try:
                                     file.rename(new_path)
+                                    self._audio_cache = None
                                     renamed_count += 1
                                     logger.info(f"Renamed: {file.name} -> {new_filename}")
                                 except Exception as rename_error:
@@ -847,7 +1043,6 @@ class PlaylistSyncer:
                 except Exception as e:
                     logger.warning(f"Failed to process {file.name}: {e}")
                     # Don't skip the file - log and continue
-                    used_names[f"error_{i}"] = file
                 
                 progress_bar.update(i)
             
@@ -856,32 +1051,12 @@ class PlaylistSyncer:
             )
             
             # Final safety check
-            remaining_files = len(self.file_processor.get_audio_files(self.playlist.folder))
+            remaining_files = len(self._audio_files())
             if remaining_files < (len(audio_files) - duplicates_removed):
                 logger.error(f"CRITICAL: Expected {len(audio_files) - duplicates_removed} files, found {remaining_files}")
             
             return (renamed_count, duplicates_removed)
     
-    def _remove_from_archive(self, video_id: str):
-        """Remove video ID from archive file"""
-        try:
-            if not self.archive_file.exists():
-                return
-            
-            with open(self.archive_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            
-            # Filter out lines containing this video ID
-            pattern = re.compile(rf".*{re.escape(video_id)}.*")
-            new_lines = [line for line in lines if not pattern.search(line.strip())]
-            
-            if len(new_lines) < len(lines):
-                with open(self.archive_file, "w", encoding="utf-8") as f:
-                    f.writelines(new_lines)
-                    
-        except Exception as e:
-            logger.warning(f"Failed to update archive: {e}")
-
     def _quarantine_file(self, file: Path) -> bool:
         """Move a file to the playlist quarantine folder instead of deleting it."""
         try:
@@ -893,6 +1068,7 @@ class PlaylistSyncer:
                 timestamp = int(time.time())
                 dest = quarantine_dir / f"{file.stem}_{timestamp}{file.suffix}"
             file.replace(dest)
+            self._audio_cache = None
             return True
         except Exception as e:
             logger.warning(f"Failed to quarantine {file}: {e}")
@@ -901,39 +1077,40 @@ class PlaylistSyncer:
     def cleanup_files(self):
         """Clean up temporary and image files"""
         with self.operation_context("cleanup"):
-            self._delete_temp_files()
-            self._delete_image_files()
-    
-    def _delete_temp_files(self):
-        """Delete temporary files"""
-        temp_patterns = ["batch_*.txt", "*.part", "*.ytdl", "*.tmp"]
-        deleted_count = 0
-        
-        for pattern in temp_patterns:
-            for file in self.playlist.folder.glob(pattern):
-                try:
-                    file.unlink()
-                    deleted_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to delete {file}: {e}")
-        
-        if deleted_count > 0:
-            print(f"{Colors.GREEN}✓ Deleted {deleted_count} temporary files{Colors.RESET}")
+            self._delete_temp_and_image_files()
     
-    def _delete_image_files(self):
-        """Delete image files"""
-        deleted_count = 0
+    def _delete_temp_and_image_files(self):
+        """Delete temporary and image files in one directory read"""
+        temp_files: List[str] = []
+        image_files: List[str] = []
+        try:
+            with os.scandir(self.playlist.folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    ext = os.path.splitext(name)[1].lower()
+                    if ext in _TEMP_EXTENSIONS or (name.startswith("batch_") and ext == ".txt"):
+                        bucket = temp_files
+                    elif ext in IMAGE_EXTENSIONS:
+                        bucket = image_files
+                    else:
+                        continue
+                    if entry.is_file():
+                        bucket.append(entry.path)
+        except FileNotFoundError:
+            return
         
-        for ext in IMAGE_EXTENSIONS:
-            for file in self.playlist.folder.glob(f"*{ext}"):
+        for label, paths in (("temporary", temp_files), ("image", image_files)):
+            deleted_count = 0
+            for path in paths:
                 try:
-                    file.unlink()
+                    os.unlink(path)
                     deleted_count += 1
                 except Exception as e:
-                    logger.warning(f"Failed to delete {file}: {e}")
-        
-        if deleted_count > 0:
-            print(f"{Colors.GREEN}✓ Deleted {deleted_count} image files{Colors.RESET}")
+                    logger.warning(f"Failed to delete {path}: {e}")
+            if deleted_count > 0:
+                print(f"{Colors.GREEN}✓ Deleted {deleted_count} {label} files{Colors.RESET}")
 
     def _report_failures(self, failures: List[DownloadFailure], log_path: Optional[Path]):
         """Print and persist a summary of download failures"""
@@ -967,7 +1144,7 @@ class PlaylistSyncer:
         Main synchronization method
         
         If dry_run=True, the operation will not modify files (moves/renames are simulated).
-        If debug=True, yt-dlp runs will log verbose output to the playlist folder and keep batch files.
+        If debug=True, yt-dlp runs will log verbose output (including the URL batch) to the playlist folder.
         Returns: Dictionary with sync results
         """
         results = {
@@ -980,6 +1157,9 @@ class PlaylistSyncer:
             "success": True,
             "dry_run": dry_run
         }
+        # Files may have been renamed or replaced since the last run
+        self._file_names.clear()
+        self._audio_cache = None
         
         try:
             if mode == SyncMode.DOWNLOAD_ONLY:
@@ -1001,12 +1181,20 @@ class PlaylistSyncer:
     def _download_only_mode(self, dry_run: bool = False, debug: bool = False) -> Dict[str, Any]:
         """Download-only mode implementation"""
         print_header(f"DOWNLOAD MODE: {self.playlist.name}")
+
+        # Same remote IDs and untouched folder since the last successful run: skip
+        # metadata, downloads, cleanup and removal checks entirely.
+        if not dry_run and self.is_up_to_date():
+            print(f"\n{Colors.GREEN}✓ Up to date (no playlist or folder changes since last sync){Colors.RESET}")
+            return {"new_downloads": 0, "renamed": 0, "duplicates_removed": 0, "removed_missing": 0, "success": True}
         
         videos = self.get_playlist_videos()
         new_videos = self.get_new_videos(videos)
         
         downloaded_count = 0
         success = True
+        # Only a clean yt-dlp exit may mark the playlist up to date; see below
+        clean_exit = True
         if not new_videos:
             print(f"\n{Colors.GREEN}✓ All songs already downloaded{Colors.RESET}")
         else:
@@ -1015,6 +1203,7 @@ class PlaylistSyncer:
                 download_result = self.download_videos(new_videos, debug=debug)
                 success = download_result.success
                 downloaded_count = download_result.downloaded
+                clean_exit = download_result.returncode == 0
             else:
                 print(f"{Colors.YELLOW}Dry-run: Skipping actual downloads ({len(new_videos)} videos){Colors.RESET}")
                 downloaded_count = len(new_videos)
@@ -1024,9 +1213,8 @@ class PlaylistSyncer:
         
         # Cleanup temp files (skip actual deletions in dry-run)
         if not dry_run:
-            self._delete_temp_files()
-            # Also delete image files after the scan/downloads as requested
-            self._delete_image_files()
+            # Also deletes image files after the scan/downloads as requested
+            self._delete_temp_and_image_files()
         else:
             logger.debug("Dry-run: skipping temp file deletions and image deletions")
 
@@ -1035,11 +1223,20 @@ class PlaylistSyncer:
         # Show summary
         show_summary(
             folder=self.playlist.folder,
-            total_files=len(self.file_processor.get_audio_files(self.playlist.folder)),
+            total_files=len(self._audio_files()),
             downloaded=downloaded_count if not dry_run else len(new_videos),
             renamed=renamed,
             removed_missing=removed_missing
         )
+
+        # Failures are only parsed from per-video error lines, so a crash, kill or
+        # network error can still look like success: also require every new video
+        # to have landed before skipping future runs.
+        if success and clean_exit and not dry_run and self._last_ids_hash and self._all_present(new_videos):
+            try:
+                set_listing_fingerprint(self._state_key(), self._listing_fingerprint(self._last_ids_hash))
+            except OSError:
+                pass
         
         return {
             "new_downloads": downloaded_count if not dry_run else len(new_videos),
@@ -1062,7 +1259,7 @@ class PlaylistSyncer:
         
         show_summary(
             folder=self.playlist.folder,
-            total_files=len(self.file_processor.get_audio_files(self.playlist.folder)),
+            total_files=len(self._audio_files()),
             renamed=renamed,
             duplicates_removed=duplicates,
         )
@@ -1104,7 +1301,7 @@ class PlaylistSyncer:
         
         show_summary(
             folder=self.playlist.folder,
-            total_files=len(self.file_processor.get_audio_files(self.playlist.folder)),
+            total_files=len(self._audio_files()),
             downloaded=downloaded_count,
             renamed=renamed,
             duplicates_removed=duplicates,
@@ -1135,21 +1332,14 @@ class PlaylistSyncer:
             return 0
 
         playlist_ids = {video.id for video in playlist_videos if video.id}
-        playlist_names = set()
-        for video in playlist_videos:
-            clean_name = FileNameFormatter.format_filename(video.metadata)
-            normalized = self.file_processor.normalize_name(clean_name)
-            if normalized:
-                playlist_names.add(normalized)
-
-        audio_files = self.file_processor.get_audio_files(self.playlist.folder)
+        playlist_names = {video.normalized_name for video in playlist_videos if video.normalized_name}
+
+        audio_files = self._audio_files()
         orphan_files: List[Tuple[Path, Optional[str]]] = []
 
         for file in audio_files:
             video_id = self.file_processor.extract_video_id(file.name)
-            metadata = self.metadata_manager.get_metadata(video_id or "", file.stem)
-            clean_name = FileNameFormatter.format_filename(metadata)
-            normalized_name = self.file_processor.normalize_name(clean_name)
+            normalized_name = self._file_name_info(file, video_id)[1]
 
             remove_by_id = bool(video_id and video_id not in playlist_ids)
             remove_by_name = bool(not video_id and normalized_name and normalized_name not in playlist_names)
@@ -1162,6 +1352,7 @@ class PlaylistSyncer:
 
         print(f"\n{Colors.YELLOW}⚠ Removing {len(orphan_files)} file(s) no longer in the YouTube playlist{Colors.RESET}")
         removed_count = 0
+        removed_ids: Set[str] = set()
 
         for file, video_id in orphan_files:
             display_name = file.name
@@ -1173,11 +1364,14 @@ class PlaylistSyncer:
             if self._quarantine_file(file):
                 removed_count += 1
                 if video_id:
-                    self._remove_from_archive(video_id)
+                    removed_ids.add(video_id)
                 print(f"  {Colors.RED}🗑 Removed (moved to quarantine): {display_name}{Colors.RESET}")
             else:
                 print(f"  {Colors.RED}❌ Failed to remove: {display_name}{Colors.RESET}")
 
+        # One archive rewrite for all quarantined tracks
+        self._prune_archive_ids(removed_ids)
+
         if removed_count and not dry_run:
             print(f"{Colors.GRAY}Removed files are stored in '{self.playlist.folder / 'quarantine'}'{Colors.RESET}")
 
@@ -1185,8 +1379,7 @@ class PlaylistSyncer:
     
     def _clean_new_downloads(self, dry_run: bool = False) -> int:
         """Clean only newly downloaded files"""
-        all_files = self.file_processor.get_audio_files(self.playlist.folder)
-        new_files = self.file_processor.get_recent_files(all_files, minutes=10)
+        new_files = self.file_processor.get_recent_audio_files(self.playlist.folder, minutes=10)
         
         if not new_files:
             return 0
@@ -1199,12 +1392,7 @@ class PlaylistSyncer:
         for i, file in enumerate(new_files, 1):
             try:
                 video_id = self.file_processor.extract_video_id(file.name)
-                metadata = self.metadata_manager.get_metadata(
-                    video_id or "", 
-                    file.stem
-                )
-                
-                clean_name = FileNameFormatter.format_filename(metadata)
+                clean_name = self._file_name_info(file, video_id)[0]
                 current_clean = self.file_processor.clean_filename(file.stem)
                 
                 # Skip if already correctly named
@@ -1228,6 +1416,7 @@ class PlaylistSyncer:
                         renamed_count += 1
                     else:
                         file.rename(new_path)
+                        self._audio_cache = None
                         renamed_count += 1
                     
             except Exception as e:
@@ -1277,9 +1466,7 @@ def download_audio(video_id: str, output_folder: str) -> bool:
     output_folder.mkdir(parents=True, exist_ok=True)
     
     cmd = [
-        sys.executable,
-        "-m",
-        "yt_dlp",
+        *YTDLP_CMD,
         "-x",
         "--audio-format", "mp3",
         "--add-metadata",
@@ -2,42 +2,148 @@
 Metadata extraction and formatting
 """
 
+import atexit
+import hashlib
 import json
+import os
 import re
 import subprocess
-import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
-METADATA_CACHE_FILE = "metadata_cache.json"
+from src.core.utils import YTDLP_CMD, iter_lines_with_deadline, run_with_deadline, spawn_probe
+
+METADATA_CACHE_FILE = "metadata_cache.jsonl"
+# Videos per batched prefetch run; bounds each run's deadline at 12 s per video.
+PREFETCH_BATCH_SIZE = 25
+# Pre-JSONL cache (one pretty-printed dict); migrated on first load.
+LEGACY_METADATA_CACHE_FILE = "metadata_cache.json"
+
+# Title cleanup
+_RE_TITLE_NOISE = re.compile(
+    r"\(Official Video\)|\(Official Music Video\)|\(Official Audio\)"
+    r"|\(Lyric Video\)|\(Visualizer\)|\(Audio\)|\(Music Video\)"
+    r"|\[.*?]",  # bracketed tags
+    re.IGNORECASE,
+)
+_RE_TAGS = re.compile(r"\b(official video|official audio|lyrics|lyric video)\b", re.IGNORECASE)
+_RE_QUALITY = re.compile(r"\b(HD|4K|1080p|720p|\d{3,4}p)\b", re.IGNORECASE)
+_RE_FEAT = re.compile(r"\b(ft\.|feat\.|featuring)\b.*", re.IGNORECASE)
+_RE_SEP = re.compile(r"\s*[|–—]\s*")
+_RE_WS = re.compile(r"\s+")
+_RE_FS_UNSAFE = re.compile(r'[<>:"/\\|?*]')
+
+# Title parsing, tried in order
+_TITLE_PATTERNS = [
+    (re.compile(r"^(.*?)\s*[-–—]\s*(.*?)\s*(?:\((.*?)\))?$", re.IGNORECASE), "dash"),
+    (re.compile(r'^(.*?)\s*["\'](.*?)["\'](?:\s*\((.*?)\))?$', re.IGNORECASE), "quote"),
+    (re.compile(r"^(.*?)\s+by\s+(.*?)(?:\s*\((.*?)\))?$", re.IGNORECASE), "by"),
+]
+
+# Duplicate markers such as "(dup)", "(copy)" or "(2)"
+_DUP_MARKER = re.compile(r"\s*\((?:dup|copy|\d+)\)\s*", re.IGNORECASE)
+
+
+def _record_line(rec: Dict[str, str]) -> str:
+    """One compact JSONL line; the cache is machine-read, so no padding."""
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _url_key(url: str) -> str:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
 
 
 class MetadataManager:
-    """Manages metadata extraction and caching"""
+    """Manages metadata extraction and caching
+
+    The cache is an append-only JSON Lines log holding {"video_id": ..., **metadata}
+    records and {"url_key": ..., "title": ...} records for single-download title
+    lookups. Later records win on load, and close() compacts the log once it
+    holds more than twice as many lines as live entries.
+    """
     
     def __init__(self):
         project_root = Path(__file__).resolve().parents[2]
         self.cache_file = project_root / METADATA_CACHE_FILE
-        self.cache = self._load_cache()
+        self.legacy_cache_file = project_root / LEGACY_METADATA_CACHE_FILE
+        self._lock = threading.Lock()
+        self.cache, self.title_cache = self._load_cache()
+        atexit.register(self.close)
+
+    def _read_log(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str], int]:
+        """Read the JSONL cache, returning (entries, titles by URL key, line count)."""
+        cache: Dict[str, Dict[str, str]] = {}
+        titles: Dict[str, str] = {}
+        lines = 0
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    rec = json.loads(line)
+                    if "url_key" in rec:
+                        titles[rec["url_key"]] = rec["title"]
+                    else:
+                        cache[rec.pop("video_id")] = rec
+                except Exception:
+                    continue  # torn or hand-edited line
+        return cache, titles, lines
 
-    def _load_cache(self) -> Dict[str, Dict[str, str]]:
+    def _load_cache(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
         """Load metadata cache from file"""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                cache, titles, _ = self._read_log()
+                return cache, titles
+            except Exception:
+                return {}, {}
+        if self.legacy_cache_file.exists():
+            try:
+                with open(self.legacy_cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                self._append_records(cache)
+                return cache, {}
             except Exception:
-                return {}
-        return {}
+                return {}, {}
+        return {}, {}
 
-    def _save_cache(self):
-        """Save metadata cache to file"""
+    def _append_lines(self, records: List[Dict[str, str]]) -> None:
+        """Append raw records to the JSONL log."""
+        if not records:
+            return
+        lines = "".join(_record_line(rec) for rec in records)
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                with open(self.cache_file, "a", encoding="utf-8") as f:
+                    f.write(lines)
         except Exception as e:
             print(f"⚠ Could not save metadata cache: {e}")
 
+    def _append_records(self, records: Dict[str, Dict[str, str]]) -> None:
+        """Append cache entries to the JSONL log."""
+        self._append_lines([{"video_id": vid, **metadata} for vid, metadata in records.items()])
+
+    def close(self) -> None:
+        """Compact the cache log if superseded lines make up more than half of it."""
+        try:
+            with self._lock:
+                if not self.cache_file.exists():
+                    return
+                # Re-read rather than trusting self.cache: other managers may have appended.
+                cache, titles, lines = self._read_log()
+                if lines <= 2 * (len(cache) + len(titles)):
+                    return
+                # Write the compacted log beside the original and swap it in atomically,
+                # so a crash mid-write never leaves a truncated cache behind.
+                tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.writelines(_record_line({"video_id": vid, **metadata}) for vid, metadata in cache.items())
+                    f.writelines(_record_line({"url_key": key, "title": title}) for key, title in titles.items())
+                os.replace(tmp, self.cache_file)
+        except Exception as e:
+            print(f"⚠ Could not compact metadata cache: {e}")
+
     def get_metadata(self, video_id: str, video_title: str) -> Dict[str, str]:
         """Get clean metadata for a song"""
         if video_id and video_id in self.cache:
@@ -45,34 +151,118 @@ class MetadataManager:
         metadata = self._extract_metadata(video_id, video_title)
         if video_id:
             self.cache[video_id] = metadata
-            self._save_cache()
+            self._append_records({video_id: metadata})
         return metadata
 
+    def get_title_by_url(self, url: str, timeout: int = 15) -> Optional[str]:
+        """Return a video's original title, asking yt-dlp only on a cache miss."""
+        key = _url_key(url)
+        title = self.title_cache.get(key)
+        if title:
+            return title
+        cmd = [*YTDLP_CMD, "--no-playlist", "--skip-download", "--print", "%(title)s", url]
+        try:
+            returncode, stdout = run_with_deadline(cmd, timeout)
+        except Exception:
+            return None
+        lines = stdout.strip().splitlines() if returncode == 0 else []
+        if not lines:
+            return None
+        self.title_cache[key] = lines[0]
+        self._append_lines([{"url_key": key, "title": lines[0]}])
+        return lines[0]
+
+    def prefetch(self, titles: Dict[str, str], workers: int = 4) -> int:
+        """Resolve uncached video IDs with batched yt-dlp runs, `workers` at a time.
+
+        `titles` maps video ID to its playlist title. Entries yt-dlp cannot
+        resolve stay uncached, so get_metadata falls back to the per-video path.
+        Returns the number of entries added to the cache.
+        """
+        missing = {vid: title for vid, title in titles.items() if vid and vid not in self.cache}
+        if not missing:
+            return 0
+
+        workers = max(1, workers)
+        ids = list(missing)
+        size = min(PREFETCH_BATCH_SIZE, -(-len(ids) // workers))
+        batches = [ids[i:i + size] for i in range(0, len(ids), size)]
+        resolved: Dict[str, Dict[str, str]] = {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+            for batch_resolved in executor.map(lambda batch: self._prefetch_batch(batch, missing), batches):
+                resolved.update(batch_resolved)
+        self.cache.update(resolved)
+        self._append_records(resolved)
+        return len(resolved)
+
+    def _prefetch_batch(self, batch: List[str], titles: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        """Run one yt-dlp over `batch`, fed as `-a -` on stdin; return what resolved."""
+        resolved: Dict[str, Dict[str, str]] = {}
+        try:
+            process = spawn_probe(
+                [
+                    *YTDLP_CMD, "--remote-components", "ejs:github",
+                    "--dump-json", "--skip-download", "--no-warnings", "--ignore-errors",
+                    "-a", "-",
+                ],
+                stdin=subprocess.PIPE,
+            )
+            # A batch is a few KB at most, well inside the pipe buffer, so it can
+            # be written up front without a feeder thread.
+            try:
+                process.stdin.write("".join(f"https://www.youtube.com/watch?v={vid}\n" for vid in batch).encode())
+            except OSError:
+                pass  # yt-dlp exited early
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            # Same 12 s per video the single-video probe allows.
+            for line in iter_lines_with_deadline(process, 12 * len(batch)):
+                try:
+                    info = json.loads(line)
+                except ValueError:
+                    continue
+                vid = info.get("id")
+                if vid not in titles:
+                    continue
+                metadata = self._metadata_from_info(info, self._clean_video_title(titles[vid]))
+                if metadata:
+                    resolved[vid] = metadata
+        except Exception:
+            pass
+        return resolved
+
+    def _metadata_from_info(self, info: Dict[str, Any], clean_title: str) -> Optional[Dict[str, str]]:
+        """Build metadata from a yt-dlp info dict; None when artist/track are missing."""
+        artist = info.get("artist") or info.get("uploader") or ""
+        track = info.get("track") or info.get("title") or clean_title
+        album = info.get("album") or ""
+        if not (artist and track):
+            return None
+        return {
+            "artist": self._clean_string(artist),
+            "track": self._clean_string(track),
+            "album": self._clean_string(album) if album else "",
+            "original_title": clean_title
+        }
+
     def _extract_metadata(self, video_id: str, video_title: str) -> Dict[str, str]:
         """Extract clean metadata from song title and YouTube info"""
         clean_title = self._clean_video_title(video_title)
         # Try yt-dlp metadata if we have an id
         if video_id:
             try:
-                result = subprocess.run(
-                    [sys.executable, "-m", "yt_dlp", "--remote-components", "ejs:github", "--dump-json", "--no-warnings", f"https://www.youtube.com/watch?v={video_id}"],
-                    capture_output=True,
-                    text=True,
+                returncode, stdout = run_with_deadline(
+                    [*YTDLP_CMD, "--remote-components", "ejs:github", "--dump-json", "--no-warnings", f"https://www.youtube.com/watch?v={video_id}"],
                     timeout=12
                 )
-                if result.returncode == 0 and result.stdout:
+                if returncode == 0 and stdout:
                     try:
-                        info = json.loads(result.stdout)
-                        artist = info.get("artist") or info.get("uploader") or ""
-                        track = info.get("track") or info.get("title") or clean_title
-                        album = info.get("album") or ""
-                        if artist and track:
-                            return {
-                                "artist": self._clean_string(artist),
-                                "track": self._clean_string(track),
-                                "album": self._clean_string(album) if album else "",
-                                "original_title": clean_title
-                            }
+                        metadata = self._metadata_from_info(json.loads(stdout), clean_title)
+                        if metadata:
+                            return metadata
                     except Exception:
                         pass
             except Exception:
@@ -89,31 +279,19 @@ class MetadataManager:
 
     def _clean_video_title(self, title: str) -> str:
         """Clean YouTube song title but preserve meaningful parentheses (like album)"""
-        patterns_to_remove = [
-            r"\(Official Video\)", r"\(Official Music Video\)", r"\(Official Audio\)",
-            r"\(Lyric Video\)", r"\(Visualizer\)", r"\(Audio\)", r"\(Music Video\)",
-            r"\[.*?]",  # remove bracketed tags
-        ]
-        clean = title
-        for pattern in patterns_to_remove:
-            clean = re.sub(pattern, "", clean, flags=re.IGNORECASE)
-        clean = re.sub(r"\b(official video|official audio|lyrics|lyric video)\b", "", clean, flags=re.IGNORECASE)
-        clean = re.sub(r"\b(HD|4K|1080p|720p|\d{3,4}p)\b", "", clean, flags=re.IGNORECASE)
-        clean = re.sub(r"\b(ft\.|feat\.|featuring)\b.*", "", clean, flags=re.IGNORECASE)
-        clean = re.sub(r'\s+', ' ', clean)
-        clean = re.sub(r'\s*[|–—]\s*', ' - ', clean)
+        clean = _RE_TITLE_NOISE.sub("", title)
+        clean = _RE_TAGS.sub("", clean)
+        clean = _RE_QUALITY.sub("", clean)
+        clean = _RE_FEAT.sub("", clean)
+        clean = _RE_WS.sub(" ", clean)
+        clean = _RE_SEP.sub(" - ", clean)
         clean = clean.strip(' -')
         return clean.strip()
 
     def _parse_music_title(self, title: str) -> Dict[str, str]:
         """Parse music title into artist, track, and album"""
-        patterns = [
-            (r"^(.*?)\s*[-–—]\s*(.*?)\s*(?:\((.*?)\))?$", "dash"),
-            (r'^(.*?)\s*["\'](.*?)["\'](?:\s*\((.*?)\))?$', "quote"),
-            (r"^(.*?)\s+by\s+(.*?)(?:\s*\((.*?)\))?$", "by"),
-        ]
-        for pattern, kind in patterns:
-            m = re.match(pattern, title, re.IGNORECASE)
+        for pattern, kind in _TITLE_PATTERNS:
+            m = pattern.match(title)
             if m:
                 if kind == "dash":
                     artist = self._clean_string(m.group(1))
@@ -141,14 +319,27 @@ class MetadataManager:
         """Clean a string for use in filenames"""
         if not text:
             return ""
-        text = re.sub(r'[<>:"/\\|?*]', '_', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_FS_UNSAFE.sub('_', text)
+        text = _RE_WS.sub(' ', text)
         text = text.strip(' ._-')
         if len(text) > 100:
             text = text[:97] + "..."
         return text
 
 
+_shared_manager: Optional[MetadataManager] = None
+_shared_lock = threading.Lock()
+
+
+def get_metadata_manager() -> MetadataManager:
+    """Process-wide MetadataManager, so the cache file is parsed once per run."""
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = MetadataManager()
+        return _shared_manager
+
+
 class FileNameFormatter:
     """Formats filenames from metadata"""
     
@@ -171,31 +362,16 @@ class FileNameFormatter:
         """Clean a component for use in filenames"""
         if not text:
             return ""
-        # Remove ALL duplicate markers (multiple passes to catch nested ones)
+        # Remove ALL duplicate markers -- (dup), (copy), (1), (2), etc. -- in one
+        # pass; removing one never exposes another, so no fixed-point loop.
         original = text
-        while True:
-            # Remove (dup), (copy), (1), (2), etc.
-            new_text = re.sub(r'\s*\(dup\)\s*$', '', text, flags=re.IGNORECASE)
-            new_text = re.sub(r'\s*\(copy\)\s*$', '', new_text, flags=re.IGNORECASE)
-            new_text = re.sub(r'\s*\(\d+\)\s*$', '', new_text)
-            new_text = re.sub(r'\s*\(dup\)\s*', ' ', new_text, flags=re.IGNORECASE)
-            new_text = re.sub(r'\s*\(copy\)\s*', ' ', new_text, flags=re.IGNORECASE)
-            new_text = re.sub(r'\s*\(\d+\)\s*', ' ', new_text)
-            
-            # Remove multiple spaces
-            new_text = re.sub(r'\s+', ' ', new_text)
-            new_text = new_text.strip()
-            
-            if new_text == text:
-                break
-            text = new_text
+        text = _RE_WS.sub(' ', _DUP_MARKER.sub(' ', text)).strip()
         
         # If we removed everything, use original
         if not text:
-            text = original
+            text = _RE_WS.sub(' ', original)
         
         # Clean file system unsafe characters
-        text = re.sub(r'[<>:"/\\|?*]', '_', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_FS_UNSAFE.sub('_', text)
         text = text.strip(' .')
         return text
\ No newline at end of file
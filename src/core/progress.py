@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+import threading
 import time
 from typing import Optional
 
@@ -38,7 +40,17 @@ def format_eta(seconds: Optional[float]) -> str:
 
 
 class ProgressBar:
-    """Animated progress bar for terminal"""
+    """Animated progress bar for terminal
+
+    Repaints are throttled to MIN_PAINT_INTERVAL by elapsed time alone, and frames
+    identical to the last one are skipped. A frame the throttle holds back stays
+    pending and is painted once the interval has passed (or by complete()), so the
+    bar never sits on a stale value; force=True always paints.
+    """
+
+    MIN_PAINT_INTERVAL = 1 / 30
+    # Leading edge glyph per quarter of overall progress
+    BAR_TIPS = ("▏", "▌", "▊", "█")
 
     def __init__(
         self,
@@ -55,30 +67,71 @@ class ProgressBar:
         self.spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self.spinner_idx = 0
         self.show_counts = show_counts
-
-    def update(self, value: float, status: str = "", total: Optional[float] = None) -> None:
+        # Invariant frame pieces: "\r<spinner> <title> [" per spinner glyph, and "] ".
+        title_seg = f"{Colors.BOLD}{title:<20}{Colors.RESET} " if title else ""
+        self._prefixes = [
+            f"\r{Colors.CYAN}{ch}{Colors.RESET} {title_seg}[{Colors.GREEN}" for ch in self.spinner_chars
+        ]
+        self._bar_close = f"{Colors.RESET}] {Colors.BOLD}"
+        self._full = "█" * width
+        self._empty = "░" * width
+        self._last_paint = 0.0
+        self._last_frame: Optional[tuple] = None
+        # Latest (percent, frame, status) held back by the throttle, and the timer that paints it
+        self._pending: Optional[tuple] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        # Updates may come from yt-dlp hook threads while the flush timer fires
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        value: float,
+        status: str = "",
+        total: Optional[float] = None,
+        force: bool = False,
+    ) -> None:
         """Update progress bar."""
-        if total is not None and total > 0:
-            self.total = float(total)
-        self.current = max(0.0, float(value))
-        denom = self.total if self.total > 0 else max(self.current, 1.0)
-        percent = (self.current / denom) if denom else 0.0
-        percent = max(0.0, min(percent, 1.0))
+        with self._lock:
+            if total is not None and total > 0:
+                self.total = float(total)
+            self.current = max(0.0, float(value))
+            denom = self.total if self.total > 0 else max(self.current, 1.0)
+            percent = (self.current / denom) if denom else 0.0
+            percent = max(0.0, min(percent, 1.0))
+            frame = (round(percent * 100, 2), self.current, status)
+            if not force:
+                if frame == self._last_frame:
+                    self._pending = None
+                    return
+                wait = self.MIN_PAINT_INTERVAL - (time.monotonic() - self._last_paint)
+                if wait > 0:
+                    self._pending = (percent, frame, status)
+                    if self._flush_timer is None:
+                        self._flush_timer = threading.Timer(wait, self._flush_pending)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                    return
+            self._paint(percent, frame, status)
+
+    def _flush_pending(self) -> None:
+        """Timer callback: paint the frame the throttle held back, if still pending."""
+        with self._lock:
+            self._flush_timer = None
+            if self._pending is not None:
+                self._paint(*self._pending)
+
+    def _paint(self, percent: float, frame: tuple, status: str) -> None:
+        """Write one frame; the caller holds the lock."""
+        self._pending = None
+        self._last_frame = frame
+        self._last_paint = time.monotonic()
         filled = int(percent * self.width)
-        # Create gradient bar
-        bar = ""
+        # Create gradient bar by slicing the prebuilt templates
         if filled > 0:
-            bar += "█" * (filled - 1)
-            pct_val = percent * 100
-            if pct_val < 25:
-                bar += "▏"
-            elif pct_val < 50:
-                bar += "▌"
-            elif pct_val < 75:
-                bar += "▊"
-            else:
-                bar += "█"
-        bar += "░" * (self.width - filled)
+            tip = self.BAR_TIPS[min(int(percent * 100) // 25, 3)]
+            bar = self._full[:filled - 1] + tip + self._empty[:self.width - filled]
+        else:
+            bar = self._empty
         # Calculate ETA
         elapsed = time.time() - self.start_time
         if self.current > 0 and elapsed > 0 and self.total > 0:
@@ -88,26 +141,32 @@ class ProgressBar:
             eta_str = f"ETA: {self._format_time(eta)}"
         else:
             eta_str = ""
-        # Spinner
-        spinner = self.spinner_chars[self.spinner_idx % len(self.spinner_chars)]
+        # Build display string (spinner advances one glyph per frame)
+        parts = [
+            self._prefixes[self.spinner_idx % len(self._prefixes)],
+            bar,
+            self._bar_close,
+            f"{percent*100:6.2f}%",
+            Colors.RESET,
+        ]
         self.spinner_idx += 1
-        # Build display string
-        display = f"\r{Colors.CYAN}{spinner}{Colors.RESET} "
-        if self.title:
-            display += f"{Colors.BOLD}{self.title:<20}{Colors.RESET} "
-        display += f"[{Colors.GREEN}{bar}{Colors.RESET}] {Colors.BOLD}{percent*100:6.2f}%{Colors.RESET}"
         if self.show_counts and self.total > 0:
-            display += f" {Colors.GRAY}({self._format_units(self.current)}/{self._format_units(self.total)}){Colors.RESET}"
+            parts.append(f" {Colors.GRAY}({self._format_units(self.current)}/{self._format_units(self.total)}){Colors.RESET}")
         if eta_str:
-            display += f" {Colors.GRAY}{eta_str}{Colors.RESET}"
+            parts.append(f" {Colors.GRAY}{eta_str}{Colors.RESET}")
         if status:
-            display += f" {Colors.YELLOW}{status}{Colors.RESET}"
-        print(display, end="", flush=True)
+            parts.append(f" {Colors.YELLOW}{status}{Colors.RESET}")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
     def complete(self, message: str = "") -> None:
         """Complete the progress bar."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
         final_value = self.total if self.total > 0 else self.current
-        self.update(final_value, message)
+        self.update(final_value, message, force=True)
         print()
 
     def _format_time(self, seconds: float) -> str:
@@ -2,14 +2,18 @@
 Settings management
 """
 
+import copy
+import hashlib
 import json
 import os
+import shutil
 import subprocess
-import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-import tkinter as tk
-from tkinter import filedialog
+from typing import Container, Dict, Any, Iterator, List, Tuple, Optional
 
 from src.core.utils import (
     select_download_folder,
@@ -17,529 +21,682 @@ from src.core.utils import (
     extract_playlist_id,
     normalize_url,
     is_probably_url,
+    YTDLP_CMD,
 )
 from src.ui.colors import Colors
 
+try:
+    import orjson  # optional, several times faster than the stdlib encoder/decoder
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 SETTINGS_FILE = Path(__file__).resolve().parents[2] / "settings.json"
 
-DEFAULT_SETTINGS = {
-    "download_path": str(Path.home() / "Music" / "YouTube Playlists"),
-    "playlists": [],
-    "max_workers": 4,
-    "new_playlists": [],  # NEW: Track newly added playlists
-}
+# Scripted/CI runs: skip the interactive preferences flow and keep settings as they are.
+_ENV_NONINTERACTIVE = os.environ.get("YPM_NONINTERACTIVE", "").lower() in {"1", "true", "yes"}
+
+@lru_cache(maxsize=1)
+def _default_base() -> Path:
+    """Default base folder; resolved on first use, since Path.home() may query the user profile."""
+    return Path.home() / "Music" / "YouTube Playlists"
+
+
+def default_settings() -> Dict[str, Any]:
+    """Fresh default settings; nothing in the result is shared between calls."""
+    return {
+        "download_path": str(_default_base()),
+        "playlists": [],
+        "max_workers": 4,
+        "new_playlists": [],  # NEW: Track newly added playlists
+    }
+
+# Pure string helpers, called over and over with the same names/URLs while
+# loading and editing the playlist list.
+_sanitize_folder_name = lru_cache(maxsize=512)(sanitize_folder_name)
+_extract_playlist_id = lru_cache(maxsize=512)(extract_playlist_id)
+_normalize_url = lru_cache(maxsize=512)(normalize_url)
+_is_probably_url = lru_cache(maxsize=512)(is_probably_url)
+
+# Last settings read or written, keyed by the file's (mtime_ns, size)
+_CACHE: Dict[str, Any] = {"stamp": None, "data": None}
+
+
+def _file_stamp() -> Tuple[int, int]:
+    st = SETTINGS_FILE.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _remember(settings: Dict[str, Any]) -> None:
+    try:
+        _CACHE["stamp"] = _file_stamp()
+        _CACHE["data"] = copy.deepcopy(settings)
+    except OSError:
+        _CACHE["stamp"] = None
+
+
+def _content_hash(settings: Dict[str, Any]) -> Optional[bytes]:
+    try:
+        return hashlib.blake2b(_json_dumps(settings), digest_size=8).digest()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _playlist_key_for(url: str, playlist_id: str) -> str:
+    url_norm = _normalize_url(url)
+    pid = (playlist_id or _extract_playlist_id(url_norm) or "").strip()
+    return (pid or url_norm).strip().lower()
+
+
+def _playlist_key(item: Dict[str, Any]) -> str:
+    """Identity of a playlist entry: its playlist ID, else its normalized URL (lowercased)."""
+    return _playlist_key_for(str(item.get("url", "") or ""), str(item.get("playlist_id") or ""))
+
+
+def _list_subfolders(base_dir: Path) -> List[Path]:
+    """Non-hidden subfolders of base_dir ([] if it can't be read)."""
+    try:
+        # scandir's entries carry the file type from the directory read itself,
+        # so only symlinks cost an extra stat.
+        with os.scandir(base_dir) as it:
+            return [Path(e.path) for e in it if not e.name.startswith(".") and e.is_dir()]
+    except OSError:
+        return []
+
+
+def _clean_marker() -> Path:
+    """Sidecar holding the digest of the last settings.json that needed no cleanup."""
+    return SETTINGS_FILE.with_name(f".{SETTINGS_FILE.name}.hash")
+
+
+def _bytes_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 def load_settings() -> Dict[str, Any]:
     """Load settings from file"""
-    if SETTINGS_FILE.exists():
+    try:
+        stamp = _file_stamp()
+    except OSError:
+        return default_settings()  # no settings file yet
+    try:
+        # Unchanged since we last read or wrote it: skip the parse and normalization pass.
+        if _CACHE["stamp"] is not None and _CACHE["stamp"] == stamp:
+            return copy.deepcopy(_CACHE["data"])
+        # Closed before parsing: a repair save os.replace()s this file, which Windows
+        # refuses while it is still open.
+        with open(SETTINGS_FILE, "rb") as f:
+            data = f.read()
+        settings = _json_loads(data)
+        # Same bytes as the last file found clean: skip the dedupe/merge/validation pass.
+        digest = _bytes_digest(data)
         try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                settings = json.load(f)
-                # Ensure new_playlists key exists for backward compatibility
-                if "new_playlists" not in settings:
-                    settings["new_playlists"] = []
+            if _clean_marker().read_text(encoding="ascii").strip() == digest:
+                _remember(settings)
+                return settings
+        except OSError:
+            pass
 
-                changed = False
+        changed = False
 
-                def _dedupe_and_normalize_playlist_list(value: Any) -> Tuple[List[Dict[str, Any]], bool]:
-                    if not isinstance(value, list):
-                        return [], True
+        # Ensure new_playlists key exists for backward compatibility
+        # (and persist it, so the file can be marked clean with the key present)
+        if "new_playlists" not in settings:
+            settings["new_playlists"] = []
+            changed = True
 
-                    cleaned: List[Dict[str, Any]] = []
-                    seen_keys: set[str] = set()
-                    local_changed = False
+        def _dedupe_and_normalize_playlist_list(
+            value: Any,
+        ) -> Tuple[List[Tuple[str, Dict[str, Any], bool]], bool]:
+            """Return the surviving (key, item, has_valid_url) entries and whether anything was rewritten."""
+            if not isinstance(value, list):
+                return [], True
 
-                    for item in value:
-                        if not isinstance(item, dict):
-                            local_changed = True
-                            continue
+            cleaned: List[Tuple[str, Dict[str, Any], bool]] = []
+            seen_keys: set[str] = set()
+            local_changed = False
 
-                        url = str(item.get("url", "") or "").strip()
-                        url_norm = normalize_url(url)
-                        if url_norm != url:
-                            item = {**item, "url": url_norm}
-                            local_changed = True
+            for item in value:
+                if not isinstance(item, dict):
+                    local_changed = True
+                    continue
 
-                        playlist_id = item.get("playlist_id") or extract_playlist_id(url_norm)
-                        if playlist_id and item.get("playlist_id") != playlist_id:
-                            item = {**item, "playlist_id": playlist_id}
-                            local_changed = True
+                url = str(item.get("url", "") or "").strip()
+                url_norm = _normalize_url(url)
+                if url_norm != url:
+                    item = {**item, "url": url_norm}
+                    local_changed = True
 
-                        key = (playlist_id or url_norm).strip().lower()
-                        if not key:
-                            local_changed = True
-                            continue
-                        if key in seen_keys:
-                            local_changed = True
-                            continue
+                playlist_id = item.get("playlist_id") or _extract_playlist_id(url_norm)
+                if playlist_id and item.get("playlist_id") != playlist_id:
+                    item = {**item, "playlist_id": playlist_id}
+                    local_changed = True
 
-                        seen_keys.add(key)
-                        cleaned.append(item)
-
-                    return cleaned, local_changed
-
-                playlists, playlists_changed = _dedupe_and_normalize_playlist_list(settings.get("playlists", []))
-                new_playlists, new_playlists_changed = _dedupe_and_normalize_playlist_list(settings.get("new_playlists", []))
-
-                # Ensure new playlists are actually syncable.
-                # Historically, newly-added entries were tracked in `new_playlists` but `main.py` only syncs `playlists`.
-                # Merge any missing entries into `playlists` while keeping `new_playlists` for bookkeeping.
-                merged = False
-                playlist_keys: set[str] = set()
-                for item in playlists:
-                    url_norm = normalize_url(str(item.get("url", "") or "")).strip()
-                    pid = str(item.get("playlist_id") or extract_playlist_id(url_norm) or "").strip()
-                    key = (pid or url_norm).strip().lower()
-                    if key:
-                        playlist_keys.add(key)
-
-                for item in new_playlists:
-                    url_norm = normalize_url(str(item.get("url", "") or "")).strip()
-                    pid = str(item.get("playlist_id") or extract_playlist_id(url_norm) or "").strip()
-                    key = (pid or url_norm).strip().lower()
-                    if key and key not in playlist_keys:
-                        playlists.append(item)
-                        playlist_keys.add(key)
-                        merged = True
-
-                if playlists_changed:
-                    settings["playlists"] = playlists
-                    changed = True
-                elif merged:
-                    settings["playlists"] = playlists
-                    changed = True
-                if new_playlists_changed:
-                    settings["new_playlists"] = new_playlists
-                    changed = True
-
-                invalid = [pl for pl in settings.get("playlists", []) if not is_probably_url(pl.get("url", ""))]
-                if invalid:
-                    print(f"{Colors.YELLOW}⚠ Some configured playlists have invalid URLs and will fail:{Colors.RESET}")
-                    for pl in invalid:
-                        name = pl.get("name", "(unnamed)")
-                        url = pl.get("url", "")
-                        print(f"  - {name}: {Colors.GRAY}{url}{Colors.RESET}")
-
-                if changed:
-                    save_settings(settings)
+                key = _playlist_key(item)
+                if not key:
+                    local_changed = True
+                    continue
+                if key in seen_keys:
+                    local_changed = True
+                    continue
 
-                return settings
-        except Exception:
-            pass
-    return DEFAULT_SETTINGS.copy()
+                seen_keys.add(key)
+                cleaned.append((key, item, _is_probably_url(url_norm)))
+
+            return cleaned, local_changed
+
+        keyed_playlists, playlists_changed = _dedupe_and_normalize_playlist_list(settings.get("playlists", []))
+        keyed_new, new_playlists_changed = _dedupe_and_normalize_playlist_list(settings.get("new_playlists", []))
+        playlists = [item for _, item, _ in keyed_playlists]
+        new_playlists = [item for _, item, _ in keyed_new]
+        invalid = [item for _, item, valid in keyed_playlists if not valid]
+
+        # Ensure new playlists are actually syncable.
+        # Historically, newly-added entries were tracked in `new_playlists` but `main.py` only syncs `playlists`.
+        # Merge any missing entries into `playlists` while keeping `new_playlists` for bookkeeping.
+        # Keys come from the dedupe pass above; no URL is normalized twice.
+        merged = False
+        playlist_keys = {key for key, _, _ in keyed_playlists}
+        for key, item, valid in keyed_new:
+            if key not in playlist_keys:
+                playlists.append(item)
+                playlist_keys.add(key)
+                merged = True
+                if not valid:
+                    invalid.append(item)
+
+        if playlists_changed:
+            settings["playlists"] = playlists
+            changed = True
+        elif merged:
+            settings["playlists"] = playlists
+            changed = True
+        if new_playlists_changed:
+            settings["new_playlists"] = new_playlists
+            changed = True
+
+        if invalid:
+            # One print (one write) for the whole warning, however many entries it lists.
+            lines = [f"{Colors.YELLOW}⚠ Some configured playlists have invalid URLs and will fail:{Colors.RESET}"]
+            lines.extend(
+                f"  - {pl.get('name', '(unnamed)')}: {Colors.GRAY}{pl.get('url', '')}{Colors.RESET}"
+                for pl in invalid
+            )
+            print("\n".join(lines))
+
+        if changed:
+            save_settings(settings)
+        else:
+            _remember(settings)
+            if not invalid:
+                try:
+                    _clean_marker().write_text(digest, encoding="ascii")
+                except OSError:
+                    pass
+
+        return settings
 
+    except Exception:
+        pass
+    return default_settings()
 
-def save_settings(settings: Dict[str, Any]) -> None:
-    """Save settings to file"""
+
+def save_settings(settings: Dict[str, Any], pretty: bool = False) -> None:
+    """Save settings to file (written to a temp file, then atomically swapped in).
+    Stored minified unless pretty=True asks for an indented, hand-editable copy."""
+    tmp = SETTINGS_FILE.with_name(SETTINGS_FILE.name + ".tmp")
     try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(settings, pretty))
+        os.replace(tmp, SETTINGS_FILE)
+        _remember(settings)
     except Exception as e:
         print(f"{Colors.YELLOW}⚠ Could not save settings: {e}{Colors.RESET}")
 
 
+@contextmanager
+def settings_transaction(settings: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Group edits to settings into a single save when the block exits.
+
+    The save also runs if the block is left by an exception (Ctrl-C included), and
+    is skipped when the content ends up unchanged.
+    """
+    before = _content_hash(settings)
+    try:
+        yield settings
+    finally:
+        if before is None or _content_hash(settings) != before:
+            save_settings(settings)
+            print(f"{Colors.GREEN}✓ Settings saved!{Colors.RESET}")
+
+
 def setup_preferences(settings: Dict[str, Any]) -> Tuple[bool, List[Dict[str, str]]]:
     """Interactive setup for preferences.
     Returns: (were_new_playlists_added, new_playlists_list)
     """
+    if _ENV_NONINTERACTIVE or settings.get("noninteractive"):
+        print(f"{Colors.GRAY}Non-interactive mode: keeping current preferences.{Colors.RESET}")
+        return False, []
+
     print(f"\n{Colors.CYAN}{'='*60}{Colors.RESET}")
     print(f"{Colors.BOLD}{'PLAYLIST SYNC SETUP':^60}{Colors.RESET}")
     print(f"{Colors.CYAN}{'='*60}{Colors.RESET}\n")
     
-    current = settings.get("download_path") or DEFAULT_SETTINGS["download_path"]
+    current = settings.get("download_path") or str(_default_base())
     print(f"{Colors.YELLOW}Current base folder:{Colors.RESET}")
     print(f" {Colors.GRAY}{current}{Colors.RESET}\n")
     
-    change = input(f"{Colors.BLUE}Change folder? (y/N): {Colors.RESET}").strip().lower()
-    if change in ("y", "yes"):
-        print(f"{Colors.YELLOW}Opening folder selector...{Colors.RESET}")
-        new_path = select_download_folder(current)
-        settings["download_path"] = new_path
-        print(f"{Colors.GREEN}✓ New folder: {new_path}{Colors.RESET}\n")
-        current = new_path
-    base_folder = Path(settings.get("download_path", DEFAULT_SETTINGS["download_path"]))
-    try:
-        base_folder.mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
+    # Every edit below is written in one save on the way out (also on Ctrl-C).
+    with settings_transaction(settings):
+        # List the base folder in the background while the user answers the prompts;
+        # the first (I)mport uses this instead of scanning on the spot.
+        listing_pool = ThreadPoolExecutor(max_workers=1)
+        listed_folder = Path(current)
+        listing: Optional[Future] = listing_pool.submit(_list_subfolders, listed_folder)
+
+        change = input(f"{Colors.BLUE}Change folder? (y/N): {Colors.RESET}").strip().lower()
+        if change in ("y", "yes"):
+            print(f"{Colors.YELLOW}Opening folder selector...{Colors.RESET}")
+            new_path = select_download_folder(current)
+            settings["download_path"] = new_path
+            print(f"{Colors.GREEN}✓ New folder: {new_path}{Colors.RESET}\n")
+            current = new_path
+        base_folder = Path(current)
+        try:
+            base_folder.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+        if base_folder != listed_folder:
+            listing = listing_pool.submit(_list_subfolders, base_folder)
 
-    def _fetch_playlist_title(url: str, timeout: int = 20) -> Optional[str]:
-        """Best-effort fetch of the playlist title via yt-dlp.
+        def _fetch_playlist_title(url: str, timeout: int = 20) -> Optional[str]:
+            """Best-effort fetch of the playlist title via yt-dlp.
 
-        This keeps Option 2 self-contained and avoids importing downloader modules.
-        """
-        try:
-            cmd = [
-                sys.executable, "-m", "yt_dlp",
-                "--remote-components", "ejs:github",
-                "--flat-playlist",
-                "--skip-download",
-                "--dump-single-json",
-                url,
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-            )
-            if result.returncode != 0:
+            This keeps Option 2 self-contained and avoids importing downloader modules.
+            """
+            try:
+                cmd = [
+                    *YTDLP_CMD,
+                    "--remote-components", "ejs:github",
+                    "--flat-playlist",
+                    "--skip-download",
+                    "--dump-single-json",
+                    url,
+                ]
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False,
+                )
+                if result.returncode != 0:
+                    return None
+
+                data = json.loads(result.stdout or "{}")
+                title = data.get("title") or data.get("playlist_title")
+                if not title:
+                    return None
+                name = str(title).strip()
+                return name or None
+            except Exception:
                 return None
 
-            data = json.loads(result.stdout or "{}")
-            title = data.get("title") or data.get("playlist_title")
-            if not title:
+        def _pick_playlist_folder(base_dir: Path) -> Optional[Path]:
+            """Pick (or create) a playlist folder. Returns None if user cancels."""
+            try:
+                import tkinter as tk  # deferred: only this dialog needs Tk
+                from tkinter import filedialog
+
+                root = tk.Tk()
+                root.withdraw()
+                root.attributes("-topmost", True)
+                root.update_idletasks()
+                folder = filedialog.askdirectory(
+                    title="Select Folder to Store This Playlist",
+                    initialdir=str(base_dir),
+                    mustexist=False,
+                )
+                root.destroy()
+            except Exception:
                 return None
-            name = str(title).strip()
-            return name or None
-        except Exception:
-            return None
 
-    def _pick_playlist_folder(base_dir: Path) -> Optional[Path]:
-        """Pick (or create) a playlist folder. Returns None if user cancels."""
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes("-topmost", True)
-            root.update_idletasks()
-            folder = filedialog.askdirectory(
-                title="Select Folder to Store This Playlist",
-                initialdir=str(base_dir),
-                mustexist=False,
-            )
-            root.destroy()
-        except Exception:
-            return None
+            folder = (folder or "").strip()
+            if not folder:
+                return None
+            return Path(folder)
 
-        folder = (folder or "").strip()
-        if not folder:
-            return None
-        return Path(folder)
+        def _is_within_base(base_dir: Path, folder: Path) -> bool:
+            try:
+                folder.resolve().relative_to(base_dir.resolve())
+                return True
+            except Exception:
+                return False
+
+        def _registered_folder_keys(playlists: List[Dict[str, Any]]) -> set[str]:
+            keys: set[str] = set()
+            for pl in playlists:
+                folder_hint = (pl.get("folder") or "").strip()
+                if folder_hint:
+                    keys.add(folder_hint.strip().lower())
+                    continue
+                name = (pl.get("name") or "").strip()
+                if name:
+                    keys.add(_sanitize_folder_name(name).lower())
+            return keys
+
+        def _scan_unregistered_folders(
+            base_dir: Path,
+            playlists: List[Dict[str, Any]],
+            subfolders: Optional[List[Path]] = None,
+        ) -> List[Path]:
+            registered = _registered_folder_keys(playlists)
+            if subfolders is None:
+                missing = [p for p in _list_subfolders(base_dir) if p.name.lower() not in registered]
+            else:
+                # A prefetched listing may be a little old; drop folders gone since.
+                missing = [p for p in subfolders if p.name.lower() not in registered and p.is_dir()]
+            return sorted(missing, key=lambda p: p.name.lower())
+
+        def _unique_name(desired: str, taken: Container[str]) -> str:
+            """Return a unique playlist name based on desired, avoiding taken (lowercased)."""
+            base = (desired or "playlist").strip() or "playlist"
+            candidate = base
+            suffix = 2
+            while candidate.strip().lower() in taken:
+                candidate = f"{base}_{suffix}"
+                suffix += 1
+            return candidate
+    
+        print(f"{Colors.CYAN}{'-'*60}{Colors.RESET}")
+        print(f"{Colors.BOLD}PLAYLIST MANAGEMENT{Colors.RESET}\n")
+    
+        existing = settings.setdefault("playlists", [])
+        settings.setdefault("new_playlists", [])
+        session_new_playlists: List[Dict[str, Any]] = []  # newly added in this session
 
-    def _is_within_base(base_dir: Path, folder: Path) -> bool:
-        try:
-            folder.resolve().relative_to(base_dir.resolve())
-            return True
-        except Exception:
-            return False
+        # Entries indexed by playlist key, name and folder; every add/import/remove
+        # goes through _index/_unindex so duplicate checks stay O(1) and current.
+        playlists_by_key: Dict[str, Dict[str, Any]] = {}
+        playlists_by_name: Dict[str, Dict[str, Any]] = {}
+        playlists_by_folder: Dict[str, Dict[str, Any]] = {}
 
-    def _registered_folder_keys(playlists: List[Dict[str, Any]]) -> set[str]:
-        keys: set[str] = set()
-        for pl in playlists:
-            folder_hint = (pl.get("folder") or "").strip()
-            if folder_hint:
-                keys.add(folder_hint.strip().lower())
-                continue
+        def _index_keys(pl: Dict[str, Any]) -> List[Tuple[Dict[str, Dict[str, Any]], str]]:
             name = (pl.get("name") or "").strip()
-            if name:
-                keys.add(sanitize_folder_name(name).lower())
-        return keys
+            folder_hint = (pl.get("folder") or "").strip()
+            folder_key = folder_hint.lower() if folder_hint else (_sanitize_folder_name(name).lower() if name else "")
+            return [
+                (playlists_by_key, _playlist_key(pl)),
+                (playlists_by_name, name.lower()),
+                (playlists_by_folder, folder_key),
+            ]
 
-    def _scan_unregistered_folders(base_dir: Path, playlists: List[Dict[str, Any]]) -> List[Path]:
-        registered = _registered_folder_keys(playlists)
-        missing: List[Path] = []
-        try:
-            if not base_dir.exists():
-                return []
-            for child in base_dir.iterdir():
-                if not child.is_dir():
-                    continue
-                if child.name.startswith("."):
-                    continue
-                key = child.name.lower()
-                if key not in registered:
-                    missing.append(child)
-        except Exception:
-            return []
-        return sorted(missing, key=lambda p: p.name.lower())
-
-    def _unique_name(desired: str, taken: set[str]) -> str:
-        """Return a unique playlist name based on desired, avoiding taken (lowercased)."""
-        base = (desired or "playlist").strip() or "playlist"
-        candidate = base
-        suffix = 2
-        while candidate.strip().lower() in taken:
-            candidate = f"{base}_{suffix}"
-            suffix += 1
-        return candidate
-    
-    print(f"{Colors.CYAN}{'-'*60}{Colors.RESET}")
-    print(f"{Colors.BOLD}PLAYLIST MANAGEMENT{Colors.RESET}\n")
-    
-    existing = settings.get("playlists", [])
-    settings.setdefault("new_playlists", [])
-    session_new_playlists: List[Dict[str, Any]] = []  # newly added in this session
-
-    existing_name_keys = {
-        pl.get("name", "").strip().lower()
-        for pl in existing
-        if pl.get("name")
-    }
+        def _index(pl: Dict[str, Any]) -> None:
+            for index, key in _index_keys(pl):
+                if key:
+                    index.setdefault(key, pl)
 
-    existing_playlist_ids = set()
-    for pl in existing:
-        stored_id = pl.get("playlist_id") or extract_playlist_id(pl.get("url", ""))
-        if stored_id:
-            existing_playlist_ids.add(stored_id)
+        def _unindex(pl: Dict[str, Any]) -> None:
+            for index, key in _index_keys(pl):
+                if key and index.get(key) is pl:
+                    del index[key]
 
-    existing_folder_keys = _registered_folder_keys(existing)
+        for pl in existing:
+            _index(pl)
     
-    if existing:
-        print(f"{Colors.YELLOW}Current playlists:{Colors.RESET}")
-        for i, pl in enumerate(existing, 1):
-            print(f" {i:2}. {pl.get('name','(unnamed)')}")
-        print()
+        if existing:
+            print(f"{Colors.YELLOW}Current playlists:{Colors.RESET}")
+            for i, pl in enumerate(existing, 1):
+                print(f" {i:2}. {pl.get('name','(unnamed)')}")
+            print()
     
-    while True:
-        action = input(
-            f"{Colors.BLUE}(A)dd, (R)emove, (I)mport folders, or (F)inish? {Colors.RESET}"
-        ).strip().lower()
-        if action in ("f", "finish", ""):
-            break
-        elif action in ("a", "add"):
-            print(f"\n{Colors.GREEN}Adding new playlist:{Colors.RESET}")
-            url = input(f" {Colors.BLUE}Playlist URL: {Colors.RESET}").strip()
-            if not url:
-                print(f"{Colors.RED}URL required. Skipping.{Colors.RESET}\n")
-                continue
-
-            url = normalize_url(url)
-            if not is_probably_url(url):
-                print(f"{Colors.RED}That doesn't look like a valid URL: '{url}'. Skipping.{Colors.RESET}\n")
-                continue
-
-            # Safety: require a real playlist URL. A single-video link will scan as an empty playlist
-            # and can trigger destructive cleanup logic in sync.
-            playlist_id = extract_playlist_id(url)
-            if not playlist_id:
-                print(
-                    f"{Colors.RED}That link is not a playlist (missing 'list='). Paste a YouTube playlist URL.{Colors.RESET}\n"
-                )
-                continue
-
-            # Prevent duplicates by playlist ID before creating any folders.
-            if playlist_id in existing_playlist_ids:
-                print(
-                    f"{Colors.RED}That playlist is already configured locally (same playlist ID).{Colors.RESET}\n"
-                )
-                continue
-
-            # Fetch the real playlist name and use it as the folder name.
-            playlist_title = _fetch_playlist_title(url)
-            if not playlist_title:
-                print(
-                    f"{Colors.YELLOW}⚠ Could not fetch the playlist title via yt-dlp.{Colors.RESET}"
-                )
-                playlist_title = input(
-                    f" {Colors.BLUE}Enter a name for this playlist (recommended to match YouTube): {Colors.RESET}"
-                ).strip() or "playlist"
-            else:
-                print(f" {Colors.GRAY}Detected playlist title: {playlist_title}{Colors.RESET}")
+        try:
+            while True:
+                action = input(
+                    f"{Colors.BLUE}(A)dd, (R)emove, (I)mport folders, or (F)inish? {Colors.RESET}"
+                ).strip().lower()
+                if action in ("f", "finish", ""):
+                    break
+                elif action in ("a", "add"):
+                    print(f"\n{Colors.GREEN}Adding new playlist:{Colors.RESET}")
+                    url = input(f" {Colors.BLUE}Playlist URL: {Colors.RESET}").strip()
+                    if not url:
+                        print(f"{Colors.RED}URL required. Skipping.{Colors.RESET}\n")
+                        continue
+
+                    url = _normalize_url(url)
+                    if not _is_probably_url(url):
+                        print(f"{Colors.RED}That doesn't look like a valid URL: '{url}'. Skipping.{Colors.RESET}\n")
+                        continue
+
+                    # Safety: require a real playlist URL. A single-video link will scan as an empty playlist
+                    # and can trigger destructive cleanup logic in sync.
+                    playlist_id = _extract_playlist_id(url)
+                    if not playlist_id:
+                        print(
+                            f"{Colors.RED}That link is not a playlist (missing 'list='). Paste a YouTube playlist URL.{Colors.RESET}\n"
+                        )
+                        continue
+
+                    # Prevent duplicates by playlist ID before creating any folders.
+                    if playlist_id.lower() in playlists_by_key:
+                        print(
+                            f"{Colors.RED}That playlist is already configured locally (same playlist ID).{Colors.RESET}\n"
+                        )
+                        continue
+
+                    # Fetch the real playlist name and use it as the folder name.
+                    playlist_title = _fetch_playlist_title(url)
+                    if not playlist_title:
+                        print(
+                            f"{Colors.YELLOW}⚠ Could not fetch the playlist title via yt-dlp.{Colors.RESET}"
+                        )
+                        playlist_title = input(
+                            f" {Colors.BLUE}Enter a name for this playlist (recommended to match YouTube): {Colors.RESET}"
+                        ).strip() or "playlist"
+                    else:
+                        print(f" {Colors.GRAY}Detected playlist title: {playlist_title}{Colors.RESET}")
 
-            name = _unique_name(playlist_title, existing_name_keys)
-            name_key = name.strip().lower()
+                    name = _unique_name(playlist_title, playlists_by_name)
 
-            folder_base = sanitize_folder_name(playlist_title)
-            folder_name = folder_base
-            folder_path = base_folder / folder_name
+                    folder_base = _sanitize_folder_name(playlist_title)
+                    folder_name = folder_base
+                    folder_path = base_folder / folder_name
 
-            # If a folder already exists with the exact playlist title, reuse it if it's not registered.
-            if folder_path.exists() and folder_path.is_dir() and folder_name.strip().lower() not in existing_folder_keys:
-                print(f" {Colors.GRAY}Using existing folder: {folder_path}{Colors.RESET}")
-            else:
-                # Otherwise, choose a unique folder name.
-                suffix = 2
-                while True:
-                    key = folder_name.strip().lower()
-                    candidate = base_folder / folder_name
-
-                    # Block if name is already registered to another playlist.
-                    if key in existing_folder_keys:
-                        pass
-                    # Block if a non-folder exists at that path.
-                    elif candidate.exists() and not candidate.is_dir():
-                        pass
-                    # Block if a folder exists but is already registered.
-                    elif candidate.exists() and candidate.is_dir() and key in existing_folder_keys:
-                        pass
+                    # If a folder already exists with the exact playlist title, reuse it if it's not registered.
+                    if folder_name.strip().lower() not in playlists_by_folder and folder_path.is_dir():
+                        print(f" {Colors.GRAY}Using existing folder: {folder_path}{Colors.RESET}")
                     else:
-                        folder_path = candidate
-                        break
+                        # Otherwise, choose a unique folder name.
+                        suffix = 2
+                        while True:
+                            key = folder_name.strip().lower()
+                            candidate = base_folder / folder_name
+
+                            # Block if name is already registered to another playlist.
+                            if key in playlists_by_folder:
+                                pass
+                            # Block if a non-folder exists at that path.
+                            elif candidate.exists() and not candidate.is_dir():
+                                pass
+                            else:
+                                folder_path = candidate
+                                break
 
-                    folder_name = f"{folder_base}_{suffix}"
-                    suffix += 1
+                            folder_name = f"{folder_base}_{suffix}"
+                            suffix += 1
 
-                try:
-                    folder_path.mkdir(parents=True, exist_ok=True)
-                    if folder_path.exists():
-                        print(f" {Colors.GRAY}Folder ready: {folder_path}{Colors.RESET}")
-                except Exception as e:
-                    print(f"{Colors.RED}Failed to create folder '{folder_name}': {e}{Colors.RESET}\n")
-                    continue
+                        try:
+                            folder_path.mkdir(parents=True, exist_ok=True)  # raises unless the folder is there
+                            print(f" {Colors.GRAY}Folder ready: {folder_path}{Colors.RESET}")
+                        except Exception as e:
+                            print(f"{Colors.RED}Failed to create folder '{folder_name}': {e}{Colors.RESET}\n")
+                            continue
 
-            folder_key = folder_name.strip().lower()
+                    new_playlist = {
+                        "name": name.strip(),
+                        "url": url,
+                        "folder": folder_name,
+                        "is_new": True  # Mark as new
+                    }
+                    if playlist_id:
+                        new_playlist["playlist_id"] = playlist_id
             
-            new_playlist = {
-                "name": name.strip(),
-                "url": url,
-                "folder": folder_name,
-                "is_new": True  # Mark as new
-            }
-            if playlist_id:
-                new_playlist["playlist_id"] = playlist_id
+                    # Add to settings + session tracking (existing is settings["playlists"])
+                    existing.append(new_playlist)
+                    settings["new_playlists"].append(new_playlist)
+                    session_new_playlists.append(new_playlist)
+                    _index(new_playlist)
             
-            # Add to settings + session tracking
-            settings.setdefault("playlists", []).append(new_playlist)
-            settings.setdefault("new_playlists", []).append(new_playlist)
-            session_new_playlists.append(new_playlist)
-            existing.append(new_playlist)
-            if name_key:
-                existing_name_keys.add(name_key)
-            existing_folder_keys.add(folder_key)
-            if playlist_id:
-                existing_playlist_ids.add(playlist_id)
-            
-            print(f"{Colors.GREEN}✓ Added '{name}'{Colors.RESET}\n")
-
-        elif action in ("i", "import"):
-            unregistered = _scan_unregistered_folders(base_folder, existing)
-            if not unregistered:
-                print(f"\n{Colors.GRAY}No unregistered subfolders found under: {base_folder}{Colors.RESET}\n")
-                continue
-
-            print(f"\n{Colors.YELLOW}Found {len(unregistered)} unregistered folder(s) under:{Colors.RESET}")
-            print(f" {Colors.GRAY}{base_folder}{Colors.RESET}")
-            do_import = input(f"{Colors.BLUE}Import/register them now? (y/N): {Colors.RESET}").strip().lower()
-            if do_import not in ("y", "yes"):
-                print()
-                continue
-
-            for folder in unregistered:
-                print(f"\n{Colors.CYAN}Folder:{Colors.RESET} {folder.name}")
-                url = input(f" {Colors.BLUE}Playlist URL for this folder (blank to skip): {Colors.RESET}").strip()
-                if not url:
-                    continue
-                url = normalize_url(url)
-                if not is_probably_url(url):
-                    print(f" {Colors.RED}Invalid URL. Skipping.{Colors.RESET}")
-                    continue
+                    print(f"{Colors.GREEN}✓ Added '{name}'{Colors.RESET}\n")
+
+                elif action in ("i", "import"):
+                    prefetched = listing.result() if listing is not None else None
+                    listing = None  # later imports rescan, picking up folders made since
+                    unregistered = _scan_unregistered_folders(base_folder, existing, prefetched)
+                    if not unregistered:
+                        print(f"\n{Colors.GRAY}No unregistered subfolders found under: {base_folder}{Colors.RESET}\n")
+                        continue
+
+                    print(f"\n{Colors.YELLOW}Found {len(unregistered)} unregistered folder(s) under:{Colors.RESET}")
+                    print(f" {Colors.GRAY}{base_folder}{Colors.RESET}")
+                    do_import = input(f"{Colors.BLUE}Import/register them now? (y/N): {Colors.RESET}").strip().lower()
+                    if do_import not in ("y", "yes"):
+                        print()
+                        continue
+
+                    for folder in unregistered:
+                        print(f"\n{Colors.CYAN}Folder:{Colors.RESET} {folder.name}")
+                        url = input(f" {Colors.BLUE}Playlist URL for this folder (blank to skip): {Colors.RESET}").strip()
+                        if not url:
+                            continue
+                        url = _normalize_url(url)
+                        if not _is_probably_url(url):
+                            print(f" {Colors.RED}Invalid URL. Skipping.{Colors.RESET}")
+                            continue
 
-                playlist_id = extract_playlist_id(url)
-                if not playlist_id:
-                    print(f" {Colors.RED}That link is not a playlist (missing 'list='). Skipping.{Colors.RESET}")
-                    continue
-                if playlist_id and playlist_id in existing_playlist_ids:
-                    print(f" {Colors.RED}That playlist ID is already configured. Skipping.{Colors.RESET}")
-                    continue
+                        playlist_id = _extract_playlist_id(url)
+                        if not playlist_id:
+                            print(f" {Colors.RED}That link is not a playlist (missing 'list='). Skipping.{Colors.RESET}")
+                            continue
+                        if playlist_id.lower() in playlists_by_key:
+                            print(f" {Colors.RED}That playlist ID is already configured. Skipping.{Colors.RESET}")
+                            continue
 
-                name = folder.name
-                name_key = name.strip().lower()
-                if name_key and name_key in existing_name_keys:
-                    name = f"{name}_imported"
-                    name_key = name.lower()
+                        name = folder.name
+                        name_key = name.strip().lower()
+                        if name_key and name_key in playlists_by_name:
+                            name = f"{name}_imported"
 
-                folder_key = folder.name.lower()
-                if folder_key in existing_folder_keys:
-                    print(f" {Colors.RED}Folder already registered in settings. Skipping.{Colors.RESET}")
-                    continue
+                        folder_key = folder.name.lower()
+                        if folder_key in playlists_by_folder:
+                            print(f" {Colors.RED}Folder already registered in settings. Skipping.{Colors.RESET}")
+                            continue
 
-                imported = {
-                    "name": name,
-                    "url": url,
-                    "folder": folder.name,
-                    "is_new": False,
-                }
-                if playlist_id:
-                    imported["playlist_id"] = playlist_id
-
-                settings.setdefault("playlists", []).append(imported)
-                existing.append(imported)
-                existing_name_keys.add(name_key)
-                existing_folder_keys.add(folder_key)
-                if playlist_id:
-                    existing_playlist_ids.add(playlist_id)
-
-                print(f" {Colors.GREEN}✓ Imported '{name}'{Colors.RESET}")
-        
-        elif action in ("r", "remove") and existing:
-            try:
-                idx = int(input(f"{Colors.BLUE}Enter number to remove (1-{len(existing)}): {Colors.RESET}"))
-                if 1 <= idx <= len(existing):
-                    removed = existing.pop(idx-1)
-                    removed_name = removed.get('name','(unnamed)')
-                    print(f"{Colors.YELLOW}Removed '{removed_name}'{Colors.RESET}\n")
+                        imported = {
+                            "name": name,
+                            "url": url,
+                            "folder": folder.name,
+                            "is_new": False,
+                        }
+                        if playlist_id:
+                            imported["playlist_id"] = playlist_id
 
-                    # Update persisted playlist list
-                    try:
-                        settings["playlists"] = existing
-                    except Exception:
-                        pass
-
-                    # Keep new_playlists in sync as well (use normalized playlist key).
-                    def _playlist_key(item: Dict[str, Any]) -> str:
-                        url_norm = normalize_url(str(item.get("url", "") or "")).strip()
-                        pid = str(item.get("playlist_id") or extract_playlist_id(url_norm) or "").strip()
-                        return (pid or url_norm).strip().lower()
-
-                    removed_key = _playlist_key(removed)
-                    if removed_key:
-                        settings["new_playlists"] = [
-                            item
-                            for item in settings.get("new_playlists", [])
-                            if isinstance(item, dict) and _playlist_key(item) != removed_key
-                        ]
-
-                    # Offer to delete the playlist folder; default is to move it to a quarantine folder
-                    base = Path(settings.get("download_path", Path.home() / "Music" / "YouTube Playlists"))
-                    folder_hint = (removed.get("folder") or "").strip() or removed_name
-                    if os.path.isabs(folder_hint):
-                        playlist_folder = Path(folder_hint)
-                    else:
-                        playlist_folder = base / sanitize_folder_name(folder_hint)
-
-                    if playlist_folder.exists():
-                        choice = input(f"{Colors.BLUE}Also remove the folder for '{removed_name}'? (Q)uarantine/(D)elete/(N)o [Q]: {Colors.RESET}").strip().lower()
-
-                        # Permanently delete
-                        if choice in ("d", "delete"):
-                            confirm = input(f"{Colors.RED}PERMANENT delete '{playlist_folder}' (this cannot be undone). Confirm (y/N): {Colors.RESET}").strip().lower()
-                            if confirm in ("y", "yes"):
-                                try:
-                                    import shutil
-                                    shutil.rmtree(playlist_folder)
-                                    print(f"{Colors.RED}✖ Permanently deleted: {playlist_folder}{Colors.RESET}\n")
-                                except Exception as e:
-                                    print(f"{Colors.YELLOW}⚠ Failed to delete: {e}{Colors.RESET}\n")
-                            else:
-                                print(f"{Colors.YELLOW}Skipping permanent delete.{Colors.RESET}\n")
+                        existing.append(imported)
+                        _index(imported)
 
-                        # Move to quarantine (default)
-                        elif choice in ("q", "", "quarantine"):
+                        print(f" {Colors.GREEN}✓ Imported '{name}'{Colors.RESET}")
+        
+                elif action in ("r", "remove") and existing:
+                    try:
+                        idx = int(input(f"{Colors.BLUE}Enter number to remove (1-{len(existing)}): {Colors.RESET}"))
+                        if 1 <= idx <= len(existing):
+                            removed = existing.pop(idx-1)
+                            _unindex(removed)
+                            removed_name = removed.get('name','(unnamed)')
+                            print(f"{Colors.YELLOW}Removed '{removed_name}'{Colors.RESET}\n")
+
+                            # Update persisted playlist list
                             try:
-                                import shutil, time
-                                quarantine_dir = base / ".quarantined_playlists"
-                                quarantine_dir.mkdir(parents=True, exist_ok=True)
-                                timestamp = time.strftime('%Y%m%d-%H%M%S')
-                                dest = quarantine_dir / f"{sanitize_folder_name(removed_name)}_{timestamp}"
-                                shutil.move(str(playlist_folder), str(dest))
-                                print(f"{Colors.RED}🗄 Moved to quarantine: {dest}{Colors.RESET}\n")
-                            except Exception as e:
-                                print(f"{Colors.YELLOW}⚠ Failed to move to quarantine: {e}{Colors.RESET}\n")
+                                settings["playlists"] = existing
+                            except Exception:
+                                pass
+
+                            # Keep new_playlists in sync as well (use normalized playlist key).
+                            removed_key = _playlist_key(removed)
+                            if removed_key:
+                                settings["new_playlists"] = [
+                                    item
+                                    for item in settings.get("new_playlists", [])
+                                    if isinstance(item, dict) and _playlist_key(item) != removed_key
+                                ]
+
+                            # Offer to delete the playlist folder; default is to move it to a quarantine folder
+                            sanitized_name = _sanitize_folder_name(removed_name)
+                            folder_hint = (removed.get("folder") or "").strip()
+                            if not folder_hint:
+                                playlist_folder = base_folder / sanitized_name
+                            elif os.path.isabs(folder_hint):
+                                playlist_folder = Path(folder_hint)
+                            else:
+                                playlist_folder = base_folder / _sanitize_folder_name(folder_hint)
+
+                            if playlist_folder.exists():
+                                choice = input(f"{Colors.BLUE}Also remove the folder for '{removed_name}'? (Q)uarantine/(D)elete/(N)o [Q]: {Colors.RESET}").strip().lower()
+
+                                # Permanently delete
+                                if choice in ("d", "delete"):
+                                    confirm = input(f"{Colors.RED}PERMANENT delete '{playlist_folder}' (this cannot be undone). Confirm (y/N): {Colors.RESET}").strip().lower()
+                                    if confirm in ("y", "yes"):
+                                        try:
+                                            shutil.rmtree(playlist_folder)
+                                            print(f"{Colors.RED}✖ Permanently deleted: {playlist_folder}{Colors.RESET}\n")
+                                        except Exception as e:
+                                            print(f"{Colors.YELLOW}⚠ Failed to delete: {e}{Colors.RESET}\n")
+                                    else:
+                                        print(f"{Colors.YELLOW}Skipping permanent delete.{Colors.RESET}\n")
+
+                                # Move to quarantine (default)
+                                elif choice in ("q", "", "quarantine"):
+                                    try:
+                                        quarantine_dir = base_folder / ".quarantined_playlists"
+                                        quarantine_dir.mkdir(parents=True, exist_ok=True)
+                                        timestamp = time.strftime('%Y%m%d-%H%M%S')
+                                        dest = quarantine_dir / f"{sanitized_name}_{timestamp}"
+                                        # Same filesystem (the usual case): a single rename. shutil.move's
+                                        # copy+delete is only for when that fails, e.g. across devices.
+                                        try:
+                                            os.rename(playlist_folder, dest)
+                                        except OSError:
+                                            shutil.move(str(playlist_folder), str(dest))
+                                        print(f"{Colors.RED}🗄 Moved to quarantine: {dest}{Colors.RESET}\n")
+                                    except Exception as e:
+                                        print(f"{Colors.YELLOW}⚠ Failed to move to quarantine: {e}{Colors.RESET}\n")
+
+                                else:
+                                    print(f"{Colors.YELLOW}Left folder in place: {playlist_folder}{Colors.RESET}\n")
+                            else:
+                                print(f"{Colors.GRAY}Folder not found: {playlist_folder}{Colors.RESET}\n")
 
                         else:
-                            print(f"{Colors.YELLOW}Left folder in place: {playlist_folder}{Colors.RESET}\n")
-                    else:
-                        print(f"{Colors.GRAY}Folder not found: {playlist_folder}{Colors.RESET}\n")
-
-                else:
-                    print(f"{Colors.RED}Invalid number.{Colors.RESET}\n")
-            except Exception:
-                print(f"{Colors.RED}Invalid input.{Colors.RESET}\n")
-
-    save_settings(settings)
-    print(f"{Colors.GREEN}✓ Settings saved!{Colors.RESET}")
+                            print(f"{Colors.RED}Invalid number.{Colors.RESET}\n")
+                    except Exception:
+                        print(f"{Colors.RED}Invalid input.{Colors.RESET}\n")
+        finally:
+            listing_pool.shutdown(wait=False)
     
     # Return whether new playlists were added
     return len(session_new_playlists) > 0, session_new_playlists
\ No newline at end of file
@@ -4,9 +4,16 @@ Sync state management for tracking downloaded videos
 
 import json
 import os
-from typing import Dict, Any, Set, List
+import threading
+from pathlib import Path
+from typing import Dict, Any, Set, List, Optional
 
-STATE_FILE = "sync_state.json"
+# Anchored to the project root (like settings.json), not to whatever the cwd is.
+STATE_FILE = Path(__file__).resolve().parents[2] / "sync_state.json"
+LISTINGS_KEY = "_listings"
+
+# Playlist syncs may run on several worker threads; serialize read-modify-write.
+_state_lock = threading.Lock()
 
 
 def load_state() -> Dict[str, Any]:
@@ -54,6 +61,21 @@ def get_all_downloaded_videos() -> Dict[str, List[str]]:
     result = {}
     
     for playlist_id, playlist_state in state.items():
+        if playlist_id == LISTINGS_KEY:
+            continue
         result[playlist_id] = playlist_state.get("downloaded_videos", [])
     
-    return result
\ No newline at end of file
+    return result
+
+
+def get_listing_fingerprint(key: str) -> Optional[Dict[str, Any]]:
+    """Get the fingerprint recorded after the last successful sync of a playlist"""
+    return load_state().get(LISTINGS_KEY, {}).get(key)
+
+
+def set_listing_fingerprint(key: str, fingerprint: Dict[str, Any]) -> None:
+    """Record a playlist's fingerprint after a successful sync"""
+    with _state_lock:
+        state = load_state()
+        state.setdefault(LISTINGS_KEY, {})[key] = fingerprint
+        save_state(state)
\ No newline at end of file
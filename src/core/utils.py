@@ -2,14 +2,18 @@
 Utility functions
 """
 
+import importlib
+import locale
 import os
 import re
+import selectors
 import shutil
-import tkinter as tk
-from tkinter import filedialog
+import subprocess
+import sys
+import time
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 
 from src.ui.colors import Colors
 
@@ -20,15 +24,43 @@ IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
 # Project root is two directories up from this file (src/core/utils.py -> root)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 COOKIES_FILE = "cookies.txt"
+# yt-dlp always runs as a module of this interpreter: an absolute path, so no PATH search per spawn.
+YTDLP_CMD = (sys.executable, "-m", "yt_dlp")
 JS_RUNTIMES = ["node", "deno", "quickjs", "bun"]
+# Characters Windows forbids in file/folder names; compiled once for the sanitizers below.
+_RE_FS_UNSAFE = re.compile(r'[<>:"/\\|?*]')
+# Where a video ID can appear in a filename, in priority order: "[id]" tag first, then URL forms.
+_RE_FILENAME_VIDEO_IDS = tuple(re.compile(pattern) for pattern in (
+    r"\[([A-Za-z0-9_-]{11})\]",
+    r"[?&]v=([A-Za-z0-9_-]{11})",
+    r"youtu\.be/([A-Za-z0-9_-]{11})",
+    r"watch\?v=([A-Za-z0-9_-]{11})",
+))
+_RE_LIST_PARAM = re.compile(r"list=([A-Za-z0-9_-]+)")
 JS_RUNTIME = ""
+_YTDLP_OK: Optional[bool] = None
 
 
-def ensure_dependencies() -> None:
-    """Ensure required dependencies are installed"""
+def check_ytdlp_cached() -> bool:
+    """Return whether yt_dlp is importable, importing it at most once per process."""
+    global _YTDLP_OK
+    if _YTDLP_OK:
+        return True
+    if _YTDLP_OK is False:
+        # A pip install may have run since the last miss.
+        importlib.invalidate_caches()
     try:
-        import yt_dlp
+        import yt_dlp  # noqa: F401
     except ImportError:
+        _YTDLP_OK = False
+    else:
+        _YTDLP_OK = True
+    return _YTDLP_OK
+
+
+def ensure_dependencies() -> None:
+    """Ensure required dependencies are installed"""
+    if not check_ytdlp_cached():
         raise RuntimeError("yt-dlp module not found. Please install it with: pip install yt-dlp")
 
     global JS_RUNTIME
@@ -58,8 +90,128 @@ def cookies_path_if_exists() -> Optional[Path]:
     return p if p.exists() else None
 
 
+def spawn_probe(
+    cmd: List[str], stderr: int = subprocess.DEVNULL, stdin: int = subprocess.DEVNULL
+) -> subprocess.Popen:
+    """Start a non-interactive child with binary stdout piped.
+
+    On POSIX, close_fds=False lets CPython launch it with os.posix_spawn rather
+    than fork+exec. Nothing leaks: Python opens descriptors non-inheritable.
+    """
+    return subprocess.Popen(
+        cmd,
+        stdin=stdin,
+        stdout=subprocess.PIPE,
+        stderr=stderr,
+        close_fds=os.name != "posix",
+    )
+
+
+def iter_byte_lines_with_deadline(
+    process: subprocess.Popen,
+    timeout: float,
+    stderr_chunks: Optional[List[bytes]] = None,
+) -> Iterator[bytes]:
+    """Yield a child's raw stdout line by line as it is produced, within `timeout` seconds.
+
+    `process` must have binary stdout piped. On deadline the child is killed and
+    subprocess.TimeoutExpired is raised; otherwise process.returncode is set when
+    iteration ends. Piped stderr is collected into `stderr_chunks` if given.
+    On Linux stdout, stderr and a pidfd for the child share one selector, so the
+    wait is purely event driven; where os.pidfd_open is missing (Windows, macOS,
+    Linux before 5.3) this falls back to communicate() and yields afterwards.
+    """
+    stdout = process.stdout
+    stderr = process.stderr
+    assert stdout is not None
+    try:
+        pidfd = os.pidfd_open(process.pid)  # type: ignore[attr-defined]
+    except (AttributeError, OSError):
+        try:
+            out, err = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        if stderr_chunks is not None and err:
+            stderr_chunks.append(err)
+        yield from out.splitlines(keepends=True)
+        return
+
+    pending = b""
+    deadline = time.monotonic() + timeout
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout, selectors.EVENT_READ)
+            if stderr is not None:
+                selector.register(stderr, selectors.EVENT_READ)
+            selector.register(pidfd, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+                for key, _ in selector.select(remaining):
+                    if key.fileobj is pidfd:
+                        selector.unregister(pidfd)
+                        continue
+                    data = os.read(key.fd, 65536)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                    elif key.fileobj is stderr:
+                        if stderr_chunks is not None:
+                            stderr_chunks.append(data)
+                    else:
+                        *lines, pending = (pending + data).split(b"\n")
+                        for line in lines:
+                            yield line + b"\n"
+        if pending:
+            yield pending
+        # The pidfd reported exit, so this reaps without blocking.
+        process.wait()
+    finally:
+        os.close(pidfd)
+        # Deadline hit or the consumer stopped early: don't leave the child running.
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        stdout.close()
+        if stderr is not None:
+            stderr.close()
+
+
+def iter_lines_with_deadline(
+    process: subprocess.Popen,
+    timeout: float,
+    stderr_chunks: Optional[List[bytes]] = None,
+) -> Iterator[str]:
+    """iter_byte_lines_with_deadline, decoded with the locale's preferred encoding."""
+    encoding = locale.getpreferredencoding(False)
+    lines = iter_byte_lines_with_deadline(process, timeout, stderr_chunks)
+    try:
+        for line in lines:
+            yield line.decode(encoding, "replace")
+    finally:
+        lines.close()  # stopping early still kills the child
+
+
+def run_with_deadline(cmd: List[str], timeout: float) -> Tuple[Optional[int], str]:
+    """Run a command capturing stdout, killing it once `timeout` seconds pass.
+
+    Returns (exit code, stdout); the exit code is None if the deadline hit.
+    """
+    process = spawn_probe(cmd)
+    try:
+        out = "".join(iter_lines_with_deadline(process, timeout))
+    except subprocess.TimeoutExpired:
+        return None, ""
+    return process.returncode, out
+
+
 def select_download_folder(current: str) -> str:
     """Open folder selector dialog"""
+    import tkinter as tk  # deferred: only this dialog needs Tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
     root.attributes("-topmost", True)
@@ -74,7 +226,7 @@ def select_download_folder(current: str) -> str:
 
 def sanitize_path_component(name: str, default: str = "") -> str:
     """Sanitize a filesystem component, keeping ASCII-safe replacements."""
-    cleaned = re.sub(r'[<>:"/\\|?*]', '_', name)
+    cleaned = _RE_FS_UNSAFE.sub('_', name)
     cleaned = cleaned.strip().rstrip('.')
     return cleaned or default
 
@@ -106,14 +258,8 @@ def is_image_file(filename: str) -> bool:
 
 def get_video_id_from_filename(filename: str) -> str:
     """Extract YouTube video ID from filename"""
-    patterns = [
-        r"\[([A-Za-z0-9_-]{11})\]",
-        r"[?&]v=([A-Za-z0-9_-]{11})",
-        r"youtu\.be/([A-Za-z0-9_-]{11})",
-        r"watch\?v=([A-Za-z0-9_-]{11})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _RE_FILENAME_VIDEO_IDS:
+        match = pattern.search(filename)
         if match:
             return match.group(1)
     return ""
@@ -142,7 +288,7 @@ def extract_playlist_id(url: str) -> str:
         if "list" in params and params["list"]:
             return params["list"][0]
 
-        match = re.search(r"list=([A-Za-z0-9_-]+)", url)
+        match = _RE_LIST_PARAM.search(url)
         if match:
             return match.group(1)
     except Exception:
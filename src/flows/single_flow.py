@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import re
 import subprocess
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from src.ui.colors import Colors
 from src.core.cli import safe_input, ESCAPE_SENTINEL
+from src.core.metadata import get_metadata_manager
 from src.core.progress import ProgressBar, format_bytes, format_speed, format_eta
 from src.core.utils import (
     cookies_path_if_exists,
@@ -17,6 +18,7 @@ from src.core.utils import (
     sanitize_filename,
     select_download_folder,
     ytdlp_common_flags,
+    YTDLP_CMD,
 )
 
 
@@ -29,6 +31,54 @@ CLI_DONE_RE = re.compile(
     r"\[download\]\s+100%.*?of\s+(?P<total>\S+)\s+in\s+(?P<duration>\S+)\s+at\s+(?P<speed>\S+)",
     re.IGNORECASE,
 )
+# Index of the unit prefix letter is its power; "b" (0) and unknown prefixes mean bytes.
+_UNIT_POWERS = "bkmgt"
+
+
+def _parse_progress_line(line: str) -> Optional[Dict[str, str]]:
+    """Fast path for '[download]  42.0% of 3.50MiB at 1.20MiB/s ETA 00:02' lines.
+
+    Returns the same fields as CLI_PROGRESS_RE, or None when the line does not
+    have the expected shape (callers then fall back to the regex).
+    """
+    if not line.startswith("[download] "):
+        return None
+    percent, sep, rest = line[11:].partition("% of ")
+    if not sep:
+        return None
+    total, sep, rest = rest.partition(" at ")
+    if not sep:
+        return None
+    speed, sep, rest = rest.partition(" ETA ")
+    total_parts = total.split()
+    eta_parts = rest.split()
+    speed = speed.strip()
+    if not sep or not total_parts or not eta_parts or not speed or " " in speed:
+        return None
+    try:
+        float(percent)
+    except ValueError:
+        return None
+    return {"percent": percent.strip(), "total": total_parts[-1], "speed": speed, "eta": eta_parts[0]}
+
+
+def _parse_done_line(line: str) -> Optional[Dict[str, str]]:
+    """Fast path for '[download] 100% of 3.50MiB in 00:00:03 at 1.20MiB/s' lines."""
+    if not line.startswith("[download] "):
+        return None
+    rest = line[11:].lstrip()
+    if not rest.startswith("100% of "):
+        return None
+    total, sep, rest = rest[8:].partition(" in ")
+    if not sep:
+        return None
+    duration, sep, speed = rest.partition(" at ")
+    total_parts = total.split()
+    duration_parts = duration.split()
+    speed_parts = speed.split()
+    if not sep or not total_parts or not duration_parts or not speed_parts:
+        return None
+    return {"total": total_parts[-1], "duration": duration_parts[0], "speed": speed_parts[0]}
 
 
 def parse_size_token(token: str) -> Optional[float]:
@@ -38,17 +88,11 @@ def parse_size_token(token: str) -> Optional[float]:
         return None
     value = float(match.group("value"))
     unit = match.group("unit").lower()
-    multiplier = {
-        "b": 1,
-        "kb": 1000,
-        "kib": 1024,
-        "mb": 1000**2,
-        "mib": 1024**2,
-        "gb": 1000**3,
-        "gib": 1024**3,
-        "tb": 1000**4,
-        "tib": 1024**4,
-    }.get(unit, 1)
+    # Units are [kmgt]?i?b: the prefix letter picks the power, "i" picks base 1024.
+    power = _UNIT_POWERS.find(unit[0])
+    if power <= 0:
+        return value
+    multiplier = (1024 if "i" in unit else 1000) ** power
     return value * multiplier
 
 
@@ -83,20 +127,26 @@ def run_single_download_mode(settings: Dict[str, Any]) -> None:
         return
 
     print(f"\n{Colors.BLUE}1. Fetching metadata...{Colors.RESET}")
-    title = fetch_video_title(url)
+    # The title probe runs in the background while the user picks a destination,
+    # hiding the yt-dlp startup/network latency behind the folder dialog.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        title_future = executor.submit(fetch_video_title, url)
+
+        default_base = settings.get("download_path") or str(Path.home())
+        print(f"\n{Colors.BLUE}2. Choose destination folder{Colors.RESET}")
+        print(f"{Colors.GRAY}Default base: {default_base}{Colors.RESET}")
+        target_dir = Path(select_download_folder(default_base))
+        target_dir.mkdir(parents=True, exist_ok=True)
+        print(f"{Colors.GREEN}✓ Destination locked: {target_dir}{Colors.RESET}")
+
+        title = title_future.result()
+
     if not title:
         print(f"{Colors.YELLOW}⚠ Could not detect the title. Using a generic name.{Colors.RESET}")
         title = "downloaded_track"
     else:
         print(f"{Colors.GREEN}✓ Original title detected: {title}{Colors.RESET}")
 
-    default_base = settings.get("download_path") or str(Path.home())
-    print(f"\n{Colors.BLUE}2. Choose destination folder{Colors.RESET}")
-    print(f"{Colors.GRAY}Default base: {default_base}{Colors.RESET}")
-    target_dir = Path(select_download_folder(default_base))
-    target_dir.mkdir(parents=True, exist_ok=True)
-    print(f"{Colors.GREEN}✓ Destination locked: {target_dir}{Colors.RESET}")
-
     print(f"\n{Colors.BLUE}3. Download & tag{Colors.RESET}")
     planned_stub = sanitize_filename(title) or "downloaded_track"
     cookies_ready = cookies_path_if_exists() is not None
@@ -115,29 +165,9 @@ def run_single_download_mode(settings: Dict[str, Any]) -> None:
 
 
 def fetch_video_title(url: str, timeout: int = 15) -> Optional[str]:
-    """Use yt-dlp to fetch a video's original title."""
+    """Use yt-dlp to fetch a video's original title (cached per URL across runs)."""
     try:
-        cmd = [
-            sys.executable,
-            "-m",
-            "yt_dlp",
-            "--no-playlist",
-            "--skip-download",
-            "--print",
-            "%(title)s",
-            url,
-        ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-        if result.returncode != 0:
-            return None
-        title = result.stdout.strip().splitlines()
-        return title[0] if title else None
+        return get_metadata_manager().get_title_by_url(url, timeout)
     except Exception:
         return None
 
@@ -205,7 +235,7 @@ def _download_single_video_cli(url: str, folder: Path, display_name: str) -> boo
     safe_name = sanitize_filename(display_name) or "downloaded_track"
     output_template = str(folder / f"{safe_name}.%(ext)s")
 
-    cmd = [sys.executable, "-m", "yt_dlp", "--remote-components", "ejs:github"]
+    cmd = [*YTDLP_CMD, "--remote-components", "ejs:github"]
     cmd.extend(ytdlp_common_flags(debug=False))
     cmd.extend(
         [
@@ -248,22 +278,30 @@ def _download_single_video_cli(url: str, folder: Path, display_name: str) -> boo
         line = raw_line.strip()
         if not line:
             continue
-        match = CLI_PROGRESS_RE.search(line)
-        if match:
-            percent = float(match.group("percent"))
-            total_token = match.group("total")
-            speed_token = match.group("speed")
-            eta_token = match.group("eta")
+        # Plain string splitting handles the usual yt-dlp output; the regexes only
+        # run for [download] lines that do not have the expected shape.
+        progress = _parse_progress_line(line)
+        if progress is None and "[download]" in line:
+            match = CLI_PROGRESS_RE.search(line)
+            progress = match.groupdict() if match else None
+        if progress:
+            percent = float(progress["percent"])
+            total_token = progress["total"]
+            speed_token = progress["speed"]
+            eta_token = progress["eta"]
             total_bytes = total_bytes or parse_size_token(total_token)
             downloaded = percent / 100.0 * total_bytes if (total_bytes and total_bytes > 0) else percent
             status_text = f"{percent:5.1f}% • {speed_token} • ETA {eta_token} • total {total_token}"
             progress_bar.update(downloaded, total=total_bytes or 100.0, status=status_text)
             continue
-        match_done = CLI_DONE_RE.search(line)
-        if match_done:
-            total_token = match_done.group("total")
-            speed_token = match_done.group("speed")
-            duration_token = match_done.group("duration")
+        done = _parse_done_line(line)
+        if done is None and "[download]" in line:
+            match_done = CLI_DONE_RE.search(line)
+            done = match_done.groupdict() if match_done else None
+        if done:
+            total_token = done["total"]
+            speed_token = done["speed"]
+            duration_token = done["duration"]
             total_bytes = total_bytes or parse_size_token(total_token)
             progress_bar.update(
                 total_bytes or progress_bar.total or 1,
@@ -284,6 +322,6 @@ def _download_single_video_cli(url: str, folder: Path, display_name: str) -> boo
         progress_bar.complete("All done!")
         return True
 
-    progress_bar.update(progress_bar.current, status="Failed")
+    progress_bar.update(progress_bar.current, status="Failed", force=True)
     print(f"\n{Colors.RED}yt-dlp returned exit code {return_code}.{Colors.RESET}")
     return False
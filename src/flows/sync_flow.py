@@ -1,14 +1,108 @@
 from __future__ import annotations
 
-import time
+import logging
+import queue
+import threading
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.ui.colors import Colors
 from src.core.cli import safe_input
 from src.core.utils import sanitize_folder_name
 from src.core.downloader import PlaylistSyncer, PlaylistInfo, SyncMode
 
+logger = logging.getLogger(__name__)
+
+# How long the main thread blocks at a time while waiting on workers (see _wait_result).
+_POLL_SECONDS = 0.5
+
+# (1-based index, playlist, prepared syncer or None) work item; None tells a worker to stop.
+SyncTask = Optional[Tuple[int, PlaylistInfo, Optional[PlaylistSyncer]]]
+
+
+def _resolve_sync_workers(settings: Dict[str, Any], playlist_count: int) -> int:
+    try:
+        workers = int(settings.get("sync_workers", 1))
+    except Exception:
+        workers = 1
+    return max(1, min(workers, playlist_count))
+
+
+def _feed_tasks(
+    task_q: "queue.Queue[SyncTask]",
+    result_q: "queue.Queue[Tuple[int, Dict[str, Any]]]",
+    tasks: List[Tuple[int, PlaylistInfo]],
+    settings: Dict[str, Any],
+    workers: int,
+) -> None:
+    """Master: prepare each playlist's syncer, then one stop sentinel per worker.
+
+    Preparing includes fetching the remote listing and warming the metadata
+    cache, so the next playlist's scan overlaps the current one's downloads. It
+    prints nothing. The first `workers` playlists go to the workers unprepared:
+    no sync is running yet to overlap with, and their scan shows its own progress.
+    If the feeder itself fails, each playlist it never handed out gets an error
+    result, so the run still finishes and reports them as failed.
+    """
+    fed = 0
+    try:
+        for position, (index, pl_info) in enumerate(tasks):
+            syncer: Optional[PlaylistSyncer] = None
+            if position >= workers:
+                try:
+                    syncer = PlaylistSyncer(pl_info, settings)
+                    syncer.fetch_remote_listing()
+                except Exception:
+                    # The worker rescans (and reports any error) itself
+                    logger.debug(f"Preparing '{pl_info.name}' ahead of time failed", exc_info=True)
+            task_q.put((index, pl_info, syncer))
+            fed += 1
+    except BaseException as e:
+        logger.error(f"Sync feeder failed: {e}")
+        for index, pl_info in tasks[fed:]:
+            result_q.put((index, {"playlist": pl_info.name, "success": False, "error": f"Not started: {e}"}))
+    finally:
+        for _ in range(workers):
+            task_q.put(None)
+
+
+def _sync_worker(
+    task_q: "queue.Queue[SyncTask]",
+    result_q: "queue.Queue[Tuple[int, Dict[str, Any]]]",
+    settings: Dict[str, Any],
+    total: int,
+    debug_enabled: bool,
+) -> None:
+    """Worker: pull playlists until the sentinel arrives and report each result."""
+    while True:
+        task = task_q.get()
+        if task is None:
+            return
+        index, pl_info, syncer = task
+        print(f"\n{Colors.BLUE}[{index}/{total}]{Colors.RESET}")
+        try:
+            if syncer is None:
+                syncer = PlaylistSyncer(pl_info, settings)
+            result = syncer.sync(SyncMode.DOWNLOAD_ONLY, debug=debug_enabled)
+        except Exception as e:
+            result = {"playlist": pl_info.name, "success": False, "error": str(e)}
+        result_q.put((index, result))
+
+
+def _wait_result(
+    result_q: "queue.Queue[Tuple[int, Dict[str, Any]]]",
+) -> Tuple[int, Dict[str, Any]]:
+    """Block for the next result in short slices, so Ctrl-C still reaches this thread.
+
+    An untimed Queue.get() (or Thread.join()) cannot be interrupted on Windows.
+    """
+    while True:
+        try:
+            return result_q.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+
 
 def run_sync_mode(settings: Dict[str, Any]) -> None:
     """Menu option 1: synchronize all configured playlists in download-only mode."""
@@ -34,36 +128,54 @@ def run_sync_mode(settings: Dict[str, Any]) -> None:
             f"{Colors.YELLOW}Debug mode enabled: yt-dlp logs will be written to {PROJECT_ROOT / 'yt-dlp-logs'}{Colors.RESET}"
         )
 
-    success_count = 0
-    total_new_downloads = 0
-    total_removed = 0
-
+    tasks: List[Tuple[int, PlaylistInfo]] = []
     for index, playlist in enumerate(playlists, 1):
-        print(f"\n{Colors.BLUE}[{index}/{len(playlists)}]{Colors.RESET}")
         folder_hint = playlist.get("folder") or playlist.get("name", "playlist")
-        folder = base_path / sanitize_folder_name(str(folder_hint))
-        pl_info = PlaylistInfo(
-            name=playlist.get("name", "playlist"),
-            url=playlist.get("url", ""),
-            folder=folder,
+        tasks.append(
+            (
+                index,
+                PlaylistInfo(
+                    name=playlist.get("name", "playlist"),
+                    url=playlist.get("url", ""),
+                    folder=base_path / sanitize_folder_name(str(folder_hint)),
+                ),
+            )
         )
-        syncer = PlaylistSyncer(pl_info, settings)
-        result = syncer.sync(SyncMode.DOWNLOAD_ONLY, debug=debug_enabled)
 
-        if result.get("success", False):
-            success_count += 1
-        total_new_downloads += int(result.get("new_downloads", 0) or 0)
-        total_removed += int(result.get("removed_missing", 0) or 0)
+    # Master/worker: a feeder thread prefetches playlists into a bounded queue (so it
+    # stays about one playlist ahead of each worker), N workers sync them, and this
+    # thread folds results into the totals as they complete.
+    workers = _resolve_sync_workers(settings, len(tasks))
+    task_q: "queue.Queue[SyncTask]" = queue.Queue(maxsize=workers)
+    result_q: "queue.Queue[Tuple[int, Dict[str, Any]]]" = queue.Queue()
+    threads = [threading.Thread(target=_feed_tasks, args=(task_q, result_q, tasks, settings, workers), daemon=True)]
+    threads.extend(
+        threading.Thread(
+            target=_sync_worker,
+            args=(task_q, result_q, settings, len(tasks), debug_enabled),
+            daemon=True,
+        )
+        for _ in range(workers)
+    )
 
-        if index < len(playlists):
-            time.sleep(0.5)
+    totals: Counter[str] = Counter()
+    for thread in threads:
+        thread.start()
+    for _ in tasks:
+        _, result = _wait_result(result_q)
+        totals["success"] += int(bool(result.get("success", False)))
+        totals["new_downloads"] += int(result.get("new_downloads", 0) or 0)
+        totals["removed"] += int(result.get("removed_missing", 0) or 0)
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(_POLL_SECONDS)
 
     print(f"\n{Colors.GREEN}{'='*60}{Colors.RESET}")
     print(f"{Colors.BOLD}✅ Sync Complete!{Colors.RESET}")
-    print(f"{Colors.GREEN}✓ Processed: {success_count}/{len(playlists)} playlists{Colors.RESET}")
-    if total_new_downloads > 0:
-        print(f"{Colors.GREEN}✓ Downloaded: {total_new_downloads} new song(s){Colors.RESET}")
-    if total_removed > 0:
-        print(f"{Colors.RED}✓ Removed: {total_removed} track(s) no longer in playlist{Colors.RESET}")
+    print(f"{Colors.GREEN}✓ Processed: {totals['success']}/{len(playlists)} playlists{Colors.RESET}")
+    if totals["new_downloads"] > 0:
+        print(f"{Colors.GREEN}✓ Downloaded: {totals['new_downloads']} new song(s){Colors.RESET}")
+    if totals["removed"] > 0:
+        print(f"{Colors.RED}✓ Removed: {totals['removed']} track(s) no longer in playlist{Colors.RESET}")
     print(f"{Colors.GREEN}✓ Location: {base_path}{Colors.RESET}")
     print(f"{Colors.GREEN}{'='*60}{Colors.RESET}")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Duplicate-marker stripping in FileProcessor.clean_filename (runs under pytest or directly)."""
+from src.core.downloader import FileProcessor
+
+
+def test_single_marker():
+    assert FileProcessor.clean_filename("Song (2)") == "Song"
+    assert FileProcessor.clean_filename("Song [copy] ") == "Song"
+
+
+def test_stacked_markers():
+    assert FileProcessor.clean_filename("Song (2) (dup)") == "Song"
+    assert FileProcessor.clean_filename("Song [1](copy) (DUP)") == "Song"
+
+
+def test_inner_markers_kept():
+    assert FileProcessor.clean_filename("Song (2) Remix") == "Song (2) Remix"
+
+
+if __name__ == "__main__":
+    test_single_marker()
+    test_stacked_markers()
+    test_inner_markers_kept()
+    print("OK")